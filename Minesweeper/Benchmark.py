@@ -0,0 +1,307 @@
+"""
+Module: Benchmark
+Functions: bench_reveal, bench_placement, sampler, summarize, suite_cases, run_suite, bench_startup, compare, main
+Description: Command line benchmarks for the Minesweeper board engines, plus a suite
+                of hot-path cases (board and headless rendering) that saves its
+                results as a baseline and fails when a later run is slower by more
+                than the threshold plus the noise seen between samples.
+Inputs: Command line arguments selecting the benchmark and board sizes.
+Outputs: Timing table printed to stdout, optional JSON baseline, exit status 1 on regression.
+External Sources: NumPy (optional, only for the numpy engine), Pygame (suite render cases, dummy video driver)
+Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
+Created: October 18, 2026
+Last Modified: October 18, 2026
+
+Usage:
+    python Minesweeper/Benchmark.py reveal --sizes 100 300 1000 --engine list
+    python Minesweeper/Benchmark.py placement --size 1000 --densities 0.1 0.5 0.9 0.99
+    python Minesweeper/Benchmark.py suite --save baseline.json
+    python Minesweeper/Benchmark.py suite --compare baseline.json --threshold 0.25
+    python Minesweeper/Benchmark.py startup --runs 10 --save startup.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from MinesweeperSimulation import board_class_for
+
+def prepare_board(board_class, size, density, safe_x=0, safe_y=0):
+    """Create a size x size board with mines placed and counts calculated, so timings only cover the call under test."""
+    board = board_class(size, size, max(1, int(size * size * density)))
+    board.place_mines(safe_x=safe_x, safe_y=safe_y)
+    board.calculate_squares()
+    board.mines_placed = True
+    return board
+
+def bench_reveal(board_class, sizes, density):
+    """Time a single flood-fill reveal on large, sparse boards.
+    Linear scaling shows up as a flat ns/cell column."""
+    print(f"{'size':>8} {'opened':>12} {'seconds':>10} {'ns/cell':>10}")
+    for size in sizes:
+        board = prepare_board(board_class, size, density)
+        # Start the fill from an empty square so the cascade is as large as possible
+        start = next(((x, y) for y in range(size) for x in range(size) if board.board[y][x] == 0), (0, 0))
+        t0 = time.perf_counter()
+        opened = board.reveal_square(*start)
+        elapsed = time.perf_counter() - t0
+        print(f"{size:>8} {len(opened):>12} {elapsed:>10.4f} {elapsed / max(len(opened), 1) * 1e9:>10.1f}")
+
+def bench_placement(board_class, size, densities):
+    """Time place_mines across densities. Sampling without replacement keeps the cost
+    per mine flat, instead of blowing up as collisions become likely."""
+    print(f"{'density':>8} {'mines':>12} {'seconds':>10} {'ns/mine':>10}")
+    for density in densities:
+        board = board_class(size, size, int(size * size * density), seed=0, safe_opening=True)
+        t0 = time.perf_counter()
+        board.place_mines(safe_x=size // 2, safe_y=size // 2)
+        elapsed = time.perf_counter() - t0
+        print(f"{density:>8.2f} {board.num_mines:>12} {elapsed:>10.4f} {elapsed / max(board.num_mines, 1) * 1e9:>10.1f}")
+
+# Suite defaults
+SUITE_SIZES = (10, 100, 500, 2000)
+SUITE_DENSITIES = (0.1, 0.5, 0.9)
+MIN_SAMPLE_TIME = 0.01   # Seconds of calls per sample, so tiny operations are averaged over many calls
+MAX_CASE_TIME = 2.0      # Stop taking samples of a case after this long (big boards get a single sample)
+REPEAT = 7               # Samples per case; the median is compared
+RENDER_WINDOW = (800, 600)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Startup cases: fresh interpreter processes, timed from launch to exit
+STARTUP_CASES = (
+    ("interpreter", ["-c", "pass"]),
+    ("import_board", ["-c", "import MinesweeperBoard, MinesweeperSolver, MinesweeperSimulation"]),
+    ("first_frame", ["PlayMinesweeper.py", "--exit-after-first-frame"]),
+)
+
+def _time_calls(run, state, calls):
+    """Seconds taken by calls back-to-back run(state) calls, between one pair of clock reads."""
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        run(state)
+    return time.perf_counter() - t0
+
+def sampler(setup, run):
+    """Returns a function that takes one timing sample of run(state), returning the average
+    seconds per call and the seconds timed (at least MIN_SAMPLE_TIME of calls). A shared setup (see _once) is timed in batches of
+    calls, calibrated on the first sample, so sub-microsecond calls aren't lost in clock
+    overhead. Any other setup() builds a fresh, untimed state for each call, so run may mutate it."""
+    batch = []  # (state, calls per sample) once calibrated
+
+    def sample():
+        if getattr(setup, "shared", False):
+            if not batch:
+                state = setup()
+                calls = 1
+                while _time_calls(run, state, calls) < MIN_SAMPLE_TIME: # Grow the batch until long enough to time
+                    calls *= 2
+                batch.append((state, calls))
+            state, calls = batch[0]
+            elapsed = _time_calls(run, state, calls)
+            return elapsed / calls, elapsed
+        total = 0.0
+        calls = 0
+        while calls == 0 or total < MIN_SAMPLE_TIME:
+            state = setup()
+            t0 = time.perf_counter()
+            run(state)
+            total += time.perf_counter() - t0
+            calls += 1
+        return total / calls, total
+    return sample
+
+def summarize(samples):
+    """Returns (median, spread) of timing samples, the spread being their interquartile range
+    as a fraction of the median (0 under two samples). Quartiles, unlike the full range, don't
+    let one sample caught by a stall loosen the gate."""
+    median = statistics.median(samples)
+    if len(samples) < 2 or not median:
+        return median, 0.0
+    q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    return median, (q3 - q1) / median
+
+def _render_setup(board_class, size):
+    """Headless window, camera and renderer over a fully revealed size x size board."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame as pg # Only the render cases need Pygame
+    from MinesweeperRenderer import BoardRenderer, Camera
+    pg.init()
+    screen = pg.display.set_mode(RENDER_WINDOW)
+    board = board_class(size, size, 1)
+    board.reveal_square(0, 0)
+    camera = Camera(size, size)
+    w, h = RENDER_WINDOW
+    camera.set_viewport(pg.Rect(w // 10, h // 10, w * 8 // 10, h * 8 // 10))
+    renderer = BoardRenderer(board, camera, pg.font.Font(None, 24))
+    renderer.render(screen, 0) # First frame builds the atlas and off-screen frame
+    return screen, renderer
+
+def _once(factory):
+    """Wrap factory so it runs on the first call only; later calls return the same result.
+    Keeps expensive setups (big boards, the window) from running for filtered-out cases."""
+    cache = []
+    def get(*_):
+        if not cache:
+            cache.append(factory())
+        return cache[0]
+    get.shared = True # run() may reuse the state, so sampler() can time calls in batches
+    return get
+
+def suite_cases(board_class, sizes, densities=SUITE_DENSITIES, render=True):
+    """Yield (name, setup, run) for every suite case at every size."""
+    for size in sizes:
+        mines = max(1, size * size // 10)
+        yield (f"construct/{size}", _once(lambda: None), lambda _, size=size, mines=mines: board_class(size, size, mines))
+        for density in densities:
+            yield (f"place_mines/{size}/{density}",
+                   lambda size=size, density=density: board_class(size, size, max(1, int(size * size * density)), seed=0),
+                   lambda board, size=size: board.place_mines(safe_x=size // 2, safe_y=size // 2))
+        placed = _once(lambda size=size: prepare_board(board_class, size, 0.15))
+        yield (f"calculate_squares/{size}", placed, lambda board: board.calculate_squares())
+        # A single mine can't wall anything off, so the first reveal opens the whole board
+        yield (f"reveal_worst/{size}", lambda size=size: prepare_board(board_class, size, 0),
+               lambda board: board.reveal_square(0, 0))
+        yield (f"is_game_won/{size}", placed, lambda board: board.is_game_won())
+        yield (f"get_display_board/{size}", placed, lambda board: board.get_display_board())
+        if render:
+            window = _once(lambda size=size: _render_setup(board_class, size))
+            def full_frame(state):
+                screen, renderer = state
+                renderer.invalidate()
+                renderer.render(screen, 0)
+            def cell_frame(state):
+                screen, renderer = state
+                renderer.mark_cells([(0, 0)])
+                renderer.render(screen, 0)
+            yield (f"render_full/{size}", window, full_frame)
+            yield (f"render_cell/{size}", window, cell_frame)
+
+def run_suite(board_class, sizes, repeat=REPEAT, render=True, only=None):
+    """Run the suite in repeat rounds of one sample per case, so each case's samples are spread
+    over the whole run and a burst of machine noise lands in one sample of many cases rather
+    than in every sample of one. A case stops being sampled once its samples total MAX_CASE_TIME.
+    Returns ({case name: median seconds per call}, {case name: spread}), see summarize."""
+    samples, spent, samplers = {}, {}, {}
+    for name, setup, run in suite_cases(board_class, sizes, render=render):
+        if not only or any(name.startswith(prefix) for prefix in only):
+            samplers[name] = sampler(setup, run)
+            samples[name], spent[name] = [], 0.0
+    for round_number in range(repeat):
+        print(f"round {round_number + 1}/{repeat}", file=sys.stderr, flush=True)
+        for name, sample in samplers.items():
+            if spent[name] > MAX_CASE_TIME:
+                continue
+            seconds, timed = sample()
+            samples[name].append(seconds)
+            spent[name] += timed
+    results, spread = {}, {}
+    print(f"{'case':<32} {'us/call':>12} {'spread':>8}")
+    for name in samplers:
+        results[name], spread[name] = summarize(samples[name])
+        print(f"{name:<32} {results[name] * 1e6:>12.3f} {spread[name]:>8.1%}")
+    return results, spread
+
+def bench_startup(runs=10):
+    """Time cold starts in fresh processes: a bare interpreter, importing the board logic
+    (no Pygame), and launching the game until its first frame is on screen (dummy video
+    driver unless SDL_VIDEODRIVER is set). The cases take turns, like the suite's rounds.
+    Returns ({case name: median seconds}, {case name: spread})."""
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    launches = {name: [] for name, _ in STARTUP_CASES}
+    for _ in range(runs):
+        for name, command in STARTUP_CASES:
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable, *command], cwd=BASE_DIR, env=env, check=True,
+                           stdout=subprocess.DEVNULL)
+            launches[name].append(time.perf_counter() - t0)
+    results, spread = {}, {}
+    print(f"{'case':<16} {'median ms':>10} {'min ms':>10} {'max ms':>10}")
+    for name, times in launches.items():
+        results[f"startup/{name}"], spread[f"startup/{name}"] = summarize(times)
+        print(f"{name:<16} {statistics.median(times) * 1000:>10.1f} {min(times) * 1000:>10.1f} {max(times) * 1000:>10.1f}")
+    return results, spread
+
+def compare(results, baseline, threshold, spread=None, baseline_spread=None):
+    """Print each case against the baseline. Returns the names slower than the baseline by more
+    than threshold plus the case's spread (the larger of this run's and the baseline's), so a
+    case is only failed for a slowdown its own samples can't explain as noise."""
+    spread, baseline_spread = spread or {}, baseline_spread or {}
+    regressions = []
+    print(f"\n{'case':<32} {'baseline us':>12} {'current us':>12} {'change':>8} {'allowed':>8}")
+    for name, seconds in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<32} {'-':>12} {seconds * 1e6:>12.3f} {'new':>8}")
+            continue
+        change = seconds / before - 1 if before else 0.0
+        allowed = threshold + max(spread.get(name, 0.0), baseline_spread.get(name, 0.0))
+        slower = change > allowed
+        if slower:
+            regressions.append(name)
+        print(f"{name:<32} {before * 1e6:>12.3f} {seconds * 1e6:>12.3f} {change:>+8.1%} {allowed:>+8.1%}"
+              f"{'  REGRESSION' if slower else ''}")
+    return regressions
+
+def main(argv=None):
+    """Parse command line arguments and run the selected benchmark."""
+    parser = argparse.ArgumentParser(description="Minesweeper board engine benchmarks")
+    parser.add_argument("--engine", choices=("list", "numpy"), default="list", help="board engine to benchmark")
+    sub = parser.add_subparsers(dest="benchmark", required=True)
+
+    reveal = sub.add_parser("reveal", help="flood-fill reveal time vs opened region size")
+    reveal.add_argument("--sizes", type=int, nargs="+", default=[100, 300, 1000])
+    reveal.add_argument("--density", type=float, default=0.001, help="fraction of cells that are mines")
+
+    placement = sub.add_parser("placement", help="mine placement time across densities")
+    placement.add_argument("--size", type=int, default=1000)
+    placement.add_argument("--densities", type=float, nargs="+", default=[0.1, 0.5, 0.9, 0.99])
+
+    suite = sub.add_parser("suite", help="hot-path cases across board sizes, with baselines and a regression gate")
+    suite.add_argument("--sizes", type=int, nargs="+", default=list(SUITE_SIZES))
+    suite.add_argument("--repeat", type=int, default=REPEAT, help="samples per case (median is kept)")
+    suite.add_argument("--cases", nargs="+", help="only run cases whose name starts with one of these, e.g. reveal_worst")
+    suite.add_argument("--no-render", action="store_true", help="skip the headless rendering cases")
+
+    startup = sub.add_parser("startup", help="cold start times in fresh processes, up to the game's first frame")
+    startup.add_argument("--runs", type=int, default=10, help="launches per case (median is kept)")
+
+    for gated in (suite, startup):
+        gated.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+        gated.add_argument("--compare", metavar="PATH", help="baseline to compare against; exit 1 on regression")
+        gated.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before a case fails (0.25 = 25%%)")
+
+    args = parser.parse_args(argv)
+    board_class = board_class_for(args.engine)
+    if args.benchmark == "reveal":
+        bench_reveal(board_class, args.sizes, args.density)
+    elif args.benchmark == "placement":
+        bench_placement(board_class, args.size, args.densities)
+    elif args.benchmark in ("suite", "startup"):
+        if args.benchmark == "suite":
+            results, spread = run_suite(board_class, args.sizes, args.repeat, not args.no_render, args.cases)
+        else:
+            results, spread = bench_startup(args.runs)
+        if args.save:
+            with open(args.save, "w") as f:
+                json.dump({"engine": args.engine, "python": platform.python_version(),
+                           "machine": platform.machine(), "results": results, "spread": spread}, f, indent=2)
+        if args.compare:
+            with open(args.compare) as f:
+                baseline = json.load(f)
+            if baseline.get("engine") != args.engine:
+                print(f"warning: baseline was recorded with the {baseline.get('engine')} engine", file=sys.stderr)
+            regressions = compare(results, baseline["results"], args.threshold, spread, baseline.get("spread"))
+            if regressions:
+                print(f"{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%} plus noise: "
+                      + ", ".join(regressions), file=sys.stderr)
+                return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
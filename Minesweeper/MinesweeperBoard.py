@@ -8,14 +8,43 @@ Outputs: Minesweeper game board.
 External Sources: None
 Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
 Created: September 19, 2025 (original prototype August 25, 2025)
-Last Modified: September 19, 2025
+Last Modified: October 18, 2026
 """
 
 import random
+import time
+from bisect import bisect_right
+
+# Default board layout (10x10). Other sizes are passed to Minesweeper/Game.
+BOARD_WIDTH = 10
+BOARD_HEIGHT = 10
+
+# Boards generated before giving up on a no-guess layout
+NO_GUESS_ATTEMPTS = 1000
+
+# Move log action codes (see MinesweeperReplay, which stores them in 2 bits)
+MOVE_REVEAL = 0
+MOVE_FLAG = 1
+MOVE_CHORD = 2
+
+# Action names accepted by apply_actions, alongside the codes
+ACTIONS = {"reveal": MOVE_REVEAL, "flag": MOVE_FLAG, "chord": MOVE_CHORD}
+
+# int8 codes in snapshot(): revealed numbers are 0-8 and revealed mines -1, as on the board
+SNAPSHOT_MINE = -1
+SNAPSHOT_HIDDEN = -2
+SNAPSHOT_FLAG = -3
+
+# bytes.translate table from snapshot bytes to one-character codes "0"-"8", "*", "?" and "F"
+SNAPSHOT_TEXT = bytes.maketrans(bytes([*range(9), SNAPSHOT_MINE & 0xFF, SNAPSHOT_HIDDEN & 0xFF, SNAPSHOT_FLAG & 0xFF]),
+                                b"012345678*?F")
 
 class Minesweeper:
-    def __init__(self, width, height, num_mines):
-        """Take a width, height, and mine number to create a Minesweeper game board."""
+    def __init__(self, width, height, num_mines, seed=None, rng=None, safe_opening=False, no_guess=False):
+        """Take a width, height, and mine number to create a Minesweeper game board.
+        seed or rng (a random.Random) make mine placement reproducible. safe_opening keeps
+        the 3x3 block around the first click free of mines; no_guess also requires the
+        board to be solvable from there without guessing (implies safe_opening)."""
         self.width = width
         self.height = height
         self.num_mines = num_mines
@@ -25,17 +54,77 @@ class Minesweeper:
         self.flags = [[False for _ in range(width)] for _ in range(height)]
         self.game_over = False
         self.mines_placed = False  # Flag to track if mines have been placed
+        self.mine_indices = []     # Flat indices of the mines placed by place_mines
+        # Running counters so win checks and stats never rescan the board
+        self.safe_cells = width * height - num_mines
+        self.safe_revealed = 0
+        self.correct_flags = 0  # Flags sitting on mines, counted once mines are placed
+        self.seed = seed
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.safe_opening = safe_opening or no_guess
+        self.no_guess = no_guess
+        self.move_log = []       # (milliseconds since first move, action, x, y) for each move that changed the board
+        self.move_start = None
+        self.share_snapshot(bytearray([SNAPSHOT_HIDDEN & 0xFF]) * (width * height)) # Kept in step for snapshot()
+
+    def __getstate__(self):
+        """Pickle/copy the snapshot as plain bytes; memoryviews can't be pickled."""
+        state = self.__dict__.copy()
+        state["display"] = self.display.tobytes()
+        del state["snapshot_rows"]
+        return state
+
+    def __setstate__(self, state):
+        """Restore a pickled board, rebuilding the snapshot views."""
+        display = bytearray(state.pop("display"))
+        self.__dict__.update(state)
+        self.share_snapshot(display)
 
     def place_mines(self, safe_x=None, safe_y=None):
-        """Place mines, ensuring the first square is safe."""
-        mines = 0
-        while mines < self.num_mines:
-            # Random position, make sure valid placement
-            x = random.randint(0, self.width-1)
-            y = random.randint(0, self.height-1)
-            if self.board[y][x] != -1 and not (x == safe_x and y == safe_y):
-                self.board[y][x] = -1
-                mines += 1
+        """Place mines, ensuring the first square (or 3x3 opening) is safe."""
+        safe = self.safe_zone(safe_x, safe_y)
+        board, width = self.board, self.width
+        for _ in range(NO_GUESS_ATTEMPTS if self.no_guess and safe else 1):
+            # Clear only the previous placement (a rejected no-guess attempt), so placing stays O(num_mines)
+            for index in self.mine_indices:
+                board[index // width][index % width] = 0
+            self.mine_indices = self.sample_mines(safe)
+            for index in self.mine_indices:
+                board[index // width][index % width] = -1
+            if not self.no_guess or not safe:
+                return
+            from MinesweeperSolver import solvable_without_guessing # Only needed for no-guess boards
+            trial = Minesweeper(self.width, self.height, self.num_mines)
+            trial.board = [row[:] for row in board]
+            trial.calculate_squares()
+            trial.mines_placed = True
+            if solvable_without_guessing(trial, safe_x, safe_y):
+                return
+        # No no-guess layout found within the attempt budget; keep the last board
+
+    def safe_zone(self, safe_x=None, safe_y=None):
+        """Sorted flat indices that must stay mine-free: the first click, plus its
+        neighbours with safe_opening when there is room for all the mines."""
+        if safe_x is None or safe_y is None:
+            return []
+        zone = [safe_y * self.width + safe_x]
+        if self.safe_opening:
+            opening = [y * self.width + x
+                       for y in range(max(safe_y - 1, 0), min(safe_y + 2, self.height))
+                       for x in range(max(safe_x - 1, 0), min(safe_x + 2, self.width))]
+            if self.width * self.height - len(opening) >= self.num_mines:
+                zone = opening
+        return sorted(zone)
+
+    def sample_mines(self, safe):
+        """Pick num_mines distinct flat indices uniformly, skipping the sorted safe
+        indices. Samples without replacement, so there are no collision retries."""
+        picks = self.rng.sample(range(self.width * self.height - len(safe)), self.num_mines)
+        if not safe:
+            return picks
+        # Pick p lands on the p-th non-safe index: shift it past every safe index at or below it
+        thresholds = [skip - i for i, skip in enumerate(safe)]
+        return [pick + bisect_right(thresholds, pick) for pick in picks]
 
     def calculate_square(self, x, y):
         """Calculate the number of adjacent mines for a given square."""
@@ -58,48 +147,164 @@ class Minesweeper:
                 self.calculate_square(x, y)
 
     def reveal_square(self, x, y):
-        """Reveal a square on the board. If 0 square, reveal adjacent squares."""
+        """Reveal a square on the board. If 0 square, reveal adjacent squares.
+        Returns a list of (x, y) coordinates that were newly revealed."""
         if self.revealed[y][x] or self.flags[y][x] or self.game_over:
-            return
+            return []
+        self.record_move(MOVE_REVEAL, x, y)
+        opened, stack = [], []
+        self.open_square(x, y, opened, stack)
+        self.flood_fill(stack, opened)
+        return opened
 
+    def open_square(self, x, y, opened, stack):
+        """Reveal one hidden square for a move, appending it to opened. Places mines on the
+        first reveal. Empty squares are pushed on stack for flood_fill; a mine ends the game."""
         # Place mines after first click, ensuring the first square is safe
         if not self.mines_placed:
             self.place_mines(safe_x=x, safe_y=y)
             self.calculate_squares()
             self.mines_placed = True
+            self.correct_flags = self.count_correct_flags()
 
         self.revealed[y][x] = True
+        self.display[y * self.width + x] = self.board[y][x]
+        opened.append((x, y))
 
-        # Mine then lose
+        # Mine then lose, after finishing any open regions still pending
         if self.board[y][x] == -1:
-            self.reveal_all_mines()
+            self.flood_fill(stack, opened)
+            opened += self.reveal_all_mines()
             self.game_over = True
             return
-
-        # If the square is empty (0), reveal adjacent squares
+        self.safe_revealed += 1
         if self.board[y][x] == 0:
-            for i in range(-1, 2):
-                for j in range(-1, 2):
-                    if 0 <= x + i < self.width and 0 <= y + j < self.height:
-                        self.reveal_square(x + i, y + j)
+            stack.append((x, y))
+
+    def flood_fill(self, stack, opened):
+        """Flood fill the open regions around the empty squares on stack with an explicit
+        stack, so large boards don't hit the recursion limit. Appends to opened."""
+        board, revealed, flags, display = self.board, self.revealed, self.flags, self.display
+        width, height = self.width, self.height
+        before = len(opened)
+        while stack:
+            cx, cy = stack.pop()
+            for ny in range(max(cy - 1, 0), min(cy + 2, height)):
+                board_row, revealed_row, flags_row = board[ny], revealed[ny], flags[ny]
+                row = ny * width
+                for nx in range(max(cx - 1, 0), min(cx + 2, width)):
+                    if revealed_row[nx] or flags_row[nx]:
+                        continue
+                    revealed_row[nx] = True
+                    value = display[row + nx] = board_row[nx]
+                    opened.append((nx, ny))
+                    if value == 0: # Keep spreading through empty squares
+                        stack.append((nx, ny))
+        self.safe_revealed += len(opened) - before
+
+    def chord_targets(self, x, y):
+        """Hidden, unflagged neighbours of a revealed number whose flags already match it, else []."""
+        value = self.board[y][x]
+        if not self.revealed[y][x] or value <= 0:
+            return []
+        hidden = []
+        flagged = 0
+        for ny in range(max(y - 1, 0), min(y + 2, self.height)):
+            for nx in range(max(x - 1, 0), min(x + 2, self.width)):
+                if self.flags[ny][nx]:
+                    flagged += 1
+                elif not self.revealed[ny][nx]:
+                    hidden.append((nx, ny))
+        return hidden if flagged == value else []
+
+    def chord_square(self, x, y):
+        """Chord a revealed number: if as many neighbours are flagged as the number says,
+        reveal all of its other hidden neighbours in one move.
+        Returns a list of (x, y) coordinates that were newly revealed."""
+        if self.game_over:
+            return []
+        targets = self.chord_targets(x, y)
+        if not targets:
+            return []
+        self.record_move(MOVE_CHORD, x, y)
+        opened, stack = [], []
+        for tx, ty in targets:
+            if self.game_over:
+                break
+            self.open_square(tx, ty, opened, stack)
+        self.flood_fill(stack, opened)
+        return opened
+
+    def apply_actions(self, batch):
+        """Apply (action, x, y) moves in order, where action is "reveal", "flag", "chord" or a
+        MOVE_* code. Runs of reveals share one flood fill. Returns the net change as a dict
+        of "revealed", "flagged" and "unflagged" lists of (x, y) coordinates."""
+        moves = [(ACTIONS.get(action, action), x, y) for action, x, y in batch]
+        for action, _, _ in moves:
+            if action not in (MOVE_REVEAL, MOVE_FLAG, MOVE_CHORD):
+                raise ValueError(f"Unknown action {action!r}")
+        opened, stack = [], []
+        toggled = {} # (x, y) -> flag toggled an odd number of times
+        for action, x, y in moves:
+            if self.game_over:
+                break
+            if action == MOVE_REVEAL:
+                if not self.revealed[y][x] and not self.flags[y][x]:
+                    self.record_move(MOVE_REVEAL, x, y)
+                    self.open_square(x, y, opened, stack)
+                continue
+            self.flood_fill(stack, opened) # Flags and chords depend on what is open so far
+            if action == MOVE_FLAG:
+                if not self.revealed[y][x]:
+                    self.toggle_flag(x, y)
+                    toggled[(x, y)] = not toggled.get((x, y), False)
+            else:
+                opened += self.chord_square(x, y)
+        self.flood_fill(stack, opened)
+        changed = [(x, y) for (x, y), odd in toggled.items() if odd]
+        return {
+            "revealed": opened,
+            "flagged": [(x, y) for x, y in changed if self.flags[y][x]],
+            "unflagged": [(x, y) for x, y in changed if not self.flags[y][x]],
+        }
 
     def toggle_flag(self, x, y):
         """Toggle a flag on a square if flaggable."""
         if self.revealed[y][x] or self.game_over:
             return
+        self.record_move(MOVE_FLAG, x, y)
 
         flag_status = not self.flags[y][x]
         self.flags[y][x] = flag_status
+        self.display[y * self.width + x] = SNAPSHOT_FLAG if flag_status else SNAPSHOT_HIDDEN
 
         self.flags_remaining += -1 if flag_status else 1
+        if self.board[y][x] == -1: # Only nonzero once mines are placed
+            self.correct_flags += 1 if flag_status else -1
 
     def is_game_over(self):
         """True if loss, false otherwise."""
         return self.game_over
 
     def is_game_won(self):
-        """True if all non-mine squares are revealed, false otherwise."""
-        return all(self.revealed[y][x] or self.board[y][x] == -1 for y in range(self.height) for x in range(self.width))
+        """True if all non-mine squares are revealed, false otherwise. Constant time."""
+        return self.mines_placed and self.safe_revealed == self.safe_cells
+
+    def stats(self):
+        """Returns a dict of the running board counters. Constant time."""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "mines": self.num_mines,
+            "safe_cells": self.safe_cells,
+            "safe_revealed": self.safe_revealed,
+            "safe_remaining": self.safe_cells - self.safe_revealed,
+            "flags_placed": self.num_mines - self.flags_remaining,
+            "flags_remaining": self.flags_remaining,
+            "correct_flags": self.correct_flags,
+            "game_over": self.game_over,
+            "game_won": self.is_game_won(),
+        }
 
     def get_display_board(self):
         """Returns the current state of the board for display purposes."""
@@ -114,12 +319,69 @@ class Minesweeper:
                     display_board[y].append("?") # Hidden
         return display_board
 
+    def get_display_square(self, x, y):
+        """Returns the display value of a single square: its number or -1 if revealed, "F" if flagged, "?" if hidden."""
+        if self.revealed[y][x]:
+            return self.board[y][x]
+        return "F" if self.flags[y][x] else "?"
+
+    def snapshot(self):
+        """Returns the display state as read-only int8 rows (snapshot()[y][x]): the board value
+        if revealed, SNAPSHOT_FLAG if flagged, SNAPSHOT_HIDDEN otherwise. The rows are views kept
+        up to date by every move, so they cost nothing to fetch and never need rebuilding."""
+        return self.snapshot_rows
+
+    def share_snapshot(self, buffer):
+        """Move the snapshot into buffer (any writable buffer of width * height bytes, e.g. shared
+        memory), copying the current state. Later moves update buffer in place."""
+        display = memoryview(buffer).cast("B").cast("b")
+        if display.nbytes != self.width * self.height:
+            raise ValueError(f"snapshot buffer must be {self.width * self.height} bytes, not {display.nbytes}")
+        if getattr(self, "display", None) is not None and display.obj is not self.display.obj:
+            display[:] = self.display
+        self.display = display
+        rows = display.toreadonly()
+        self.snapshot_rows = [rows[y * self.width:(y + 1) * self.width] for y in range(self.height)]
+
+    def record_move(self, action, x, y):
+        """Append a move to the move log, timestamped relative to the first move."""
+        now = time.perf_counter()
+        if self.move_start is None:
+            self.move_start = now
+        self.move_log.append((int((now - self.move_start) * 1000), action, int(x), int(y)))
+
+    def mine_bits(self):
+        """Mine layout packed one bit per square, row-major, least significant bit first."""
+        bits = bytearray((self.width * self.height + 7) // 8)
+        for y, row in enumerate(self.board):
+            for x, value in enumerate(row):
+                if value == -1:
+                    index = y * self.width + x
+                    bits[index >> 3] |= 1 << (index & 7)
+        return bytes(bits)
+
+    def load_mine_bits(self, bits):
+        """Place mines from a packed layout (any buffer, e.g. a memory map) and calculate the board."""
+        self.board = [[-1 if bits[(y * self.width + x) >> 3] >> ((y * self.width + x) & 7) & 1 else 0
+                       for x in range(self.width)] for y in range(self.height)]
+        self.mine_indices = [y * self.width + x
+                             for y, row in enumerate(self.board) for x, value in enumerate(row) if value == -1]
+        self.calculate_squares()
+        self.mines_placed = True
+        self.correct_flags = self.count_correct_flags()
+
+    def count_correct_flags(self):
+        """Count flags that sit on mines. Used to seed the counter once mines are placed."""
+        return sum(self.flags[y][x] and self.board[y][x] == -1 for y in range(self.height) for x in range(self.width))
+
     #iterates through the board and reveals all squares with mines
     def reveal_all_mines(self):
-        """Reveal all mines on the board."""
+        """Reveal all mines on the board. Returns a list of (x, y) coordinates newly revealed."""
+        opened = []
         for y in range(self.height):
             for x in range(self.width):
-                if self.board[y][x] == -1:
+                if self.board[y][x] == -1 and not self.revealed[y][x]:
                     self.revealed[y][x] = True
-
-
+                    self.display[y * self.width + x] = SNAPSHOT_MINE
+                    opened.append((x, y))
+        return opened
@@ -0,0 +1,352 @@
+"""
+Module: MinesweeperBoardNumpy
+Class: NumpyMinesweeper
+Description: NumPy-backed Minesweeper board engine for very large boards.
+                Same public interface as MinesweeperBoard.Minesweeper, but the
+                board, revealed and flag grids are packed NumPy arrays and
+                neighbour counts are computed in one vectorized pass.
+Inputs: Width, height, and number of mines defining the initial board setup.
+Outputs: Minesweeper game board.
+External Sources: NumPy
+Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
+Created: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import time
+
+import numpy as np
+
+from MinesweeperBoard import (NO_GUESS_ATTEMPTS, MOVE_REVEAL, MOVE_FLAG, MOVE_CHORD, ACTIONS,
+                              SNAPSHOT_MINE, SNAPSHOT_HIDDEN, SNAPSHOT_FLAG)
+
+class NumpyMinesweeper:
+    def __init__(self, width, height, num_mines, seed=None, rng=None, safe_opening=False, no_guess=False):
+        """Take a width, height, and mine number to create a Minesweeper game board.
+        seed or rng (a numpy Generator) make mine placement reproducible. safe_opening keeps
+        the 3x3 block around the first click free of mines; no_guess also requires the
+        board to be solvable from there without guessing (implies safe_opening)."""
+        self.width = width
+        self.height = height
+        self.num_mines = num_mines
+        self.flags_remaining = num_mines
+        self.board = np.zeros((height, width), dtype=np.int8) # -1 mine, otherwise adjacent count
+        self.revealed = np.zeros((height, width), dtype=np.bool_)
+        self.flags = np.zeros((height, width), dtype=np.bool_)
+        self.display = np.full((height, width), SNAPSHOT_HIDDEN, dtype=np.int8) # Kept in step for snapshot()
+        self.game_over = False
+        self.mines_placed = False  # Flag to track if mines have been placed
+        self.mine_indices = np.empty(0, dtype=np.intp)  # Flat indices of the mines placed by place_mines
+        # Running counters so win checks and stats never rescan the board
+        self.safe_cells = width * height - num_mines
+        self.safe_revealed = 0
+        self.correct_flags = 0  # Flags sitting on mines, counted once mines are placed
+        self.seed = seed
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.safe_opening = safe_opening or no_guess
+        self.no_guess = no_guess
+        self.move_log = []       # (milliseconds since first move, action, x, y) for each move that changed the board
+        self.move_start = None
+
+    def place_mines(self, safe_x=None, safe_y=None):
+        """Place mines, ensuring the first square (or 3x3 opening) is safe."""
+        safe = self.safe_zone(safe_x, safe_y)
+        for _ in range(NO_GUESS_ATTEMPTS if self.no_guess and safe else 1):
+            # Clear only the previous placement (a rejected no-guess attempt), so placing stays O(num_mines)
+            flat = self.board.reshape(-1)
+            flat[self.mine_indices] = 0
+            self.mine_indices = self.sample_mines(safe)
+            flat[self.mine_indices] = -1
+            if not self.no_guess or not safe:
+                return
+            from MinesweeperSolver import solvable_without_guessing # Only needed for no-guess boards
+            trial = NumpyMinesweeper(self.width, self.height, self.num_mines)
+            trial.board[...] = self.board
+            trial.calculate_squares()
+            trial.mines_placed = True
+            if solvable_without_guessing(trial, safe_x, safe_y):
+                return
+        # No no-guess layout found within the attempt budget; keep the last board
+
+    def safe_zone(self, safe_x=None, safe_y=None):
+        """Sorted flat indices that must stay mine-free: the first click, plus its
+        neighbours with safe_opening when there is room for all the mines."""
+        if safe_x is None or safe_y is None:
+            return []
+        zone = [safe_y * self.width + safe_x]
+        if self.safe_opening:
+            opening = [y * self.width + x
+                       for y in range(max(safe_y - 1, 0), min(safe_y + 2, self.height))
+                       for x in range(max(safe_x - 1, 0), min(safe_x + 2, self.width))]
+            if self.width * self.height - len(opening) >= self.num_mines:
+                zone = opening
+        return sorted(zone)
+
+    def sample_mines(self, safe):
+        """Pick num_mines distinct flat indices uniformly, skipping the sorted safe
+        indices. Samples without replacement, so there are no collision retries."""
+        picks = self.rng.choice(self.width * self.height - len(safe), size=self.num_mines, replace=False)
+        for skip in safe: # Shift picks past each excluded index, lowest first
+            picks[picks >= skip] += 1
+        return picks
+
+    def calculate_squares(self):
+        """Calculate the number of adjacent mines for all squares."""
+        mines = self.board == -1
+        # Pad by one so every cell has 8 neighbours, then sum the 9 shifted windows
+        padded = np.zeros((self.height + 2, self.width + 2), dtype=np.int8)
+        padded[1:-1, 1:-1] = mines
+        counts = np.zeros((self.height, self.width), dtype=np.int8)
+        for dy in range(3):
+            for dx in range(3):
+                counts += padded[dy:dy + self.height, dx:dx + self.width]
+        self.board[...] = np.where(mines, np.int8(-1), counts)
+
+    def calculate_square(self, x, y):
+        """Calculate the number of adjacent mines for a given square."""
+        if self.board[y, x] == -1: # Mines don't need calculation
+            return
+        window = self.board[max(y - 1, 0):y + 2, max(x - 1, 0):x + 2]
+        self.board[y, x] = np.count_nonzero(window == -1)
+
+    def reveal_square(self, x, y):
+        """Reveal a square on the board. If 0 square, reveal adjacent squares.
+        Returns an (n, 2) array of (x, y) coordinates that were newly revealed."""
+        if self.revealed[y, x] or self.flags[y, x] or self.game_over:
+            return np.empty((0, 2), dtype=np.intp)
+        self.record_move(MOVE_REVEAL, x, y)
+        opened, stack = [], []
+        self.open_square(x, y, opened, stack)
+        self.flood_fill(stack, opened)
+        return self.coordinates(opened)
+
+    def open_square(self, x, y, opened, stack):
+        """Reveal one hidden square for a move, appending its flat index to opened. Places mines
+        on the first reveal. Empty squares are pushed on stack for flood_fill; a mine ends the game."""
+        # Place mines after first click, ensuring the first square is safe
+        if not self.mines_placed:
+            self.place_mines(safe_x=x, safe_y=y)
+            self.calculate_squares()
+            self.mines_placed = True
+            self.correct_flags = self.count_correct_flags()
+
+        self.revealed[y, x] = True
+        self.display[y, x] = self.board[y, x]
+        start = y * self.width + x
+        opened.append(start)
+
+        # Mine then lose, after finishing any open regions still pending
+        if self.board[y, x] == -1:
+            self.flood_fill(stack, opened)
+            mines = self.reveal_all_mines()
+            opened.extend((mines[:, 1] * self.width + mines[:, 0]).tolist())
+            self.game_over = True
+            return
+        self.safe_revealed += 1
+        if self.board[y, x] == 0:
+            stack.append(start)
+
+    def flood_fill(self, stack, opened):
+        """Flood fill the open regions around the empty squares on stack (flat indices) with an
+        explicit stack. Memoryviews avoid per-cell NumPy scalar overhead. Appends to opened."""
+        if not stack:
+            return
+        width, height = self.width, self.height
+        board = memoryview(self.board).cast("B").cast("b")
+        revealed = memoryview(self.revealed.view(np.uint8)).cast("B")
+        flags = memoryview(self.flags.view(np.uint8)).cast("B")
+        display = memoryview(self.display).cast("B").cast("b")
+        before = len(opened)
+        while stack:
+            i = stack.pop()
+            cy, cx = divmod(i, width)
+            x_lo, x_hi = max(cx - 1, 0), min(cx + 2, width)
+            for ny in range(max(cy - 1, 0), min(cy + 2, height)):
+                row = ny * width
+                for n in range(row + x_lo, row + x_hi):
+                    if revealed[n] or flags[n]:
+                        continue
+                    revealed[n] = 1
+                    value = display[n] = board[n]
+                    opened.append(n)
+                    if value == 0: # Keep spreading through empty squares
+                        stack.append(n)
+        self.safe_revealed += len(opened) - before
+
+    def coordinates(self, flat):
+        """(n, 2) array of (x, y) coordinates for a list of flat indices."""
+        ys, xs = np.divmod(np.asarray(flat, dtype=np.intp), self.width)
+        return np.column_stack((xs, ys))
+
+    def chord_targets(self, x, y):
+        """Hidden, unflagged neighbours of a revealed number whose flags already match it, as flat indices, else []."""
+        value = self.board[y, x]
+        if not self.revealed[y, x] or value <= 0:
+            return []
+        y_lo, x_lo = max(y - 1, 0), max(x - 1, 0)
+        flags = self.flags[y_lo:y + 2, x_lo:x + 2]
+        if np.count_nonzero(flags) != value:
+            return []
+        ys, xs = np.nonzero(~(flags | self.revealed[y_lo:y + 2, x_lo:x + 2]))
+        return ((ys + y_lo) * self.width + xs + x_lo).tolist()
+
+    def chord_square(self, x, y):
+        """Chord a revealed number: if as many neighbours are flagged as the number says,
+        reveal all of its other hidden neighbours in one move.
+        Returns an (n, 2) array of (x, y) coordinates that were newly revealed."""
+        opened = self.chord(x, y)
+        return self.coordinates(opened)
+
+    def chord(self, x, y):
+        """chord_square returning flat indices."""
+        if self.game_over:
+            return []
+        targets = self.chord_targets(x, y)
+        if not targets:
+            return []
+        self.record_move(MOVE_CHORD, x, y)
+        opened, stack = [], []
+        for i in targets:
+            if self.game_over:
+                break
+            ty, tx = divmod(i, self.width)
+            self.open_square(tx, ty, opened, stack)
+        self.flood_fill(stack, opened)
+        return opened
+
+    def apply_actions(self, batch):
+        """Apply (action, x, y) moves in order, where action is "reveal", "flag", "chord" or a
+        MOVE_* code. Runs of reveals share one flood fill. Returns the net change as a dict
+        of "revealed", "flagged" and "unflagged" (n, 2) arrays of (x, y) coordinates."""
+        moves = [(ACTIONS.get(action, action), int(x), int(y)) for action, x, y in batch]
+        for action, _, _ in moves:
+            if action not in (MOVE_REVEAL, MOVE_FLAG, MOVE_CHORD):
+                raise ValueError(f"Unknown action {action!r}")
+        opened, stack = [], []
+        toggled = {} # Flat index -> flag toggled an odd number of times
+        for action, x, y in moves:
+            if self.game_over:
+                break
+            if action == MOVE_REVEAL:
+                if not self.revealed[y, x] and not self.flags[y, x]:
+                    self.record_move(MOVE_REVEAL, x, y)
+                    self.open_square(x, y, opened, stack)
+                continue
+            self.flood_fill(stack, opened) # Flags and chords depend on what is open so far
+            if action == MOVE_FLAG:
+                if not self.revealed[y, x]:
+                    self.toggle_flag(x, y)
+                    i = y * self.width + x
+                    toggled[i] = not toggled.get(i, False)
+            else:
+                opened += self.chord(x, y)
+        self.flood_fill(stack, opened)
+        changed = [i for i, odd in toggled.items() if odd]
+        flat_flags = self.flags.reshape(-1)
+        return {
+            "revealed": self.coordinates(opened),
+            "flagged": self.coordinates([i for i in changed if flat_flags[i]]),
+            "unflagged": self.coordinates([i for i in changed if not flat_flags[i]]),
+        }
+
+    def toggle_flag(self, x, y):
+        """Toggle a flag on a square if flaggable."""
+        if self.revealed[y, x] or self.game_over:
+            return
+        self.record_move(MOVE_FLAG, x, y)
+
+        flag_status = not self.flags[y, x]
+        self.flags[y, x] = flag_status
+        self.display[y, x] = SNAPSHOT_FLAG if flag_status else SNAPSHOT_HIDDEN
+
+        self.flags_remaining += -1 if flag_status else 1
+        if self.board[y, x] == -1: # Only nonzero once mines are placed
+            self.correct_flags += 1 if flag_status else -1
+
+    def is_game_over(self):
+        """True if loss, false otherwise."""
+        return self.game_over
+
+    def is_game_won(self):
+        """True if all non-mine squares are revealed, false otherwise. Constant time."""
+        return self.mines_placed and self.safe_revealed == self.safe_cells
+
+    def stats(self):
+        """Returns a dict of the running board counters. Constant time."""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "mines": self.num_mines,
+            "safe_cells": self.safe_cells,
+            "safe_revealed": self.safe_revealed,
+            "safe_remaining": self.safe_cells - self.safe_revealed,
+            "flags_placed": self.num_mines - self.flags_remaining,
+            "flags_remaining": self.flags_remaining,
+            "correct_flags": self.correct_flags,
+            "game_over": self.game_over,
+            "game_won": self.is_game_won(),
+        }
+
+    def get_display_board(self):
+        """Returns the current state of the board for display purposes."""
+        display_board = np.full((self.height, self.width), "?", dtype=object) # Hidden
+        display_board[self.flags] = "F" # Flagged
+        display_board[self.revealed] = self.board[self.revealed].astype(object) # Revealed, number or mine
+        return display_board.tolist()
+
+    def get_display_square(self, x, y):
+        """Returns the display value of a single square: its number or -1 if revealed, "F" if flagged, "?" if hidden."""
+        if self.revealed[y, x]:
+            return int(self.board[y, x])
+        return "F" if self.flags[y, x] else "?"
+
+    def snapshot(self):
+        """Returns the display state as a read-only (height, width) int8 view: the board value
+        if revealed, SNAPSHOT_FLAG if flagged, SNAPSHOT_HIDDEN otherwise. Every move keeps it
+        up to date, so fetching it never rebuilds or copies the board."""
+        view = self.display.view()
+        view.flags.writeable = False
+        return view
+
+    def share_snapshot(self, buffer):
+        """Move the snapshot into buffer (any writable buffer of width * height bytes, e.g. shared
+        memory), copying the current state. Later moves update buffer in place."""
+        display = np.frombuffer(buffer, dtype=np.int8)
+        if display.size != self.width * self.height:
+            raise ValueError(f"snapshot buffer must be {self.width * self.height} bytes, not {display.size}")
+        display = display.reshape(self.height, self.width)
+        display[...] = self.display
+        self.display = display
+
+    def record_move(self, action, x, y):
+        """Append a move to the move log, timestamped relative to the first move."""
+        now = time.perf_counter()
+        if self.move_start is None:
+            self.move_start = now
+        self.move_log.append((int((now - self.move_start) * 1000), action, int(x), int(y)))
+
+    def mine_bits(self):
+        """Mine layout packed one bit per square, row-major, least significant bit first."""
+        return np.packbits(self.board == -1, bitorder="little").tobytes()
+
+    def load_mine_bits(self, bits):
+        """Place mines from a packed layout (any buffer, e.g. a memory map) and calculate the board."""
+        packed = np.frombuffer(bits, dtype=np.uint8, count=(self.width * self.height + 7) // 8) # Zero-copy view
+        mines = np.unpackbits(packed, count=self.width * self.height, bitorder="little").reshape(self.height, self.width)
+        self.board[...] = -mines.view(np.int8)
+        self.mine_indices = np.flatnonzero(mines)
+        self.calculate_squares()
+        self.mines_placed = True
+        self.correct_flags = self.count_correct_flags()
+
+    def count_correct_flags(self):
+        """Count flags that sit on mines. Used to seed the counter once mines are placed."""
+        return int(np.count_nonzero(self.flags & (self.board == -1)))
+
+    def reveal_all_mines(self):
+        """Reveal all mines on the board. Returns an (n, 2) array of (x, y) coordinates newly revealed."""
+        hidden_mines = (self.board == -1) & ~self.revealed
+        self.revealed |= hidden_mines
+        self.display[hidden_mines] = SNAPSHOT_MINE
+        ys, xs = np.nonzero(hidden_mines)
+        return np.column_stack((xs, ys))
@@ -8,45 +8,53 @@ Outputs: Game window with interactive Minesweeper board.
 External Sources: None
 Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
 Created: September 19, 2025 (original prototype August 25, 2025)
-Last Modified: September 19, 2025
+Last Modified: October 18, 2026
 """
 
 import os
 import pygame as pg
-import pygame_textinput as textinput
-from MinesweeperBoard import Minesweeper
+from MinesweeperBoard import Minesweeper, BOARD_WIDTH, BOARD_HEIGHT
+from MinesweeperSolver import Solver
+from MinesweeperRenderer import BoardRenderer, Camera, ProfileOverlay, WHITE, BACKGROUND, TITLE_TEXT, GENERAL_TEXT
+from MinesweeperProfiler import Profiler, BOARD_HOOKS
 
-# Board layout (fixed 10x10)
-BOARD_WIDTH = 10
-BOARD_HEIGHT = 10
+# Camera controls
+ZOOM_STEP = 1.25  # Zoom factor per mouse wheel notch
+PAN_KEYS = {pg.K_LEFT: (-1, 0), pg.K_a: (-1, 0), pg.K_RIGHT: (1, 0), pg.K_d: (1, 0),
+            pg.K_UP: (0, -1), pg.K_w: (0, -1), pg.K_DOWN: (0, 1), pg.K_s: (0, 1)}
 
 # Window size limit
 MIN_WINDOW = (550, 550)
 
+# Frame rate cap while input streams in (drags, held keys); idle loops block on events instead
+FRAME_RATE = 60
+
+# Profiling (F3): renderer methods timed alongside BOARD_HOOKS, and how often the overlay refreshes when idle
+RENDERER_HOOKS = ("redraw_frame", "draw_cell", "draw_hud", "draw_overlay")
+PROFILE_REFRESH_MS = 250
+
 # Paths for assets
 BASE_DIR = os.path.dirname(__file__)
 FLAG_PATH = os.path.join(BASE_DIR, "Assets", "flag.png")
 MINE_PATH = os.path.join(BASE_DIR, "Assets", "skull.png")
 CURSOR_PATH = os.path.join(BASE_DIR, "Assets", "cursor.png")
-FONT_PATH = os.path.join(BASE_DIR, "Assets", "pixelfont.ttf")
-
-# Colors (RGB)
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-GRID_LINE = (255, 255, 255)
-HIDDEN = (247, 225, 215)
-REVEALED_EMPTY = (222, 219, 210)
-REVEALED_NUMBER = (176, 196, 177)
-MINE_RED = (219, 110, 110)
-BACKGROUND = (74, 87, 89)
-TITLE_TEXT = (240, 228, 220)
-GENERAL_TEXT = (176, 196, 177)
-TRANSPARENT_RED = (255, 155, 155, 180)
-TRANSPARENT_GREEN = (155, 255, 155, 200)
+FONT_PATH = os.path.join(BASE_DIR, "Assets", "pixelFont.ttf")
 
 class Game:
-    def __init__(self):
-        """Initialize the game."""
+    def __init__(self, board_class=Minesweeper, board_width=BOARD_WIDTH, board_height=BOARD_HEIGHT, profile_path=None,
+                 exit_after_first_frame=False, share_name=None):
+        """Initialize the game. board_class selects the board engine (e.g. NumpyMinesweeper for huge boards).
+        With profile_path the game starts with profiling on and writes the metrics there (CSV or .json) on exit.
+        exit_after_first_frame quits as soon as a frame is on screen (startup benchmark).
+        share_name publishes the board's snapshot in shared memory under that name (see MinesweeperSharedSnapshot)."""
+        self.board_class = board_class
+        self.board_width = board_width
+        self.board_height = board_height
+        self.profile_path = profile_path
+        self.exit_after_first_frame = exit_after_first_frame
+        self.share_name = share_name
+        self.profiler = None
+        self.publisher = None
         self.minesweeper = None
         self.quit = False
         self.start_ticks = None  # Set when the game actually starts
@@ -55,28 +63,75 @@ class Game:
 
     def start_game(self, width: int, height: int, num_mines: int):
         """Start a new minesweeper board with given width, height, and num_mines."""
-        self.minesweeper = Minesweeper(width, height, num_mines)
+        self.minesweeper = self.board_class(width, height, num_mines)
+        if self.share_name:
+            from MinesweeperSharedSnapshot import SnapshotPublisher # Only needed when sharing
+            if self.publisher is not None:
+                self.publisher.close()
+            self.publisher = SnapshotPublisher(self.minesweeper, self.share_name)
         self.start_ticks = pg.time.get_ticks()  # milliseconds since pg.init()
         self.end_time = None
 
     def exit_game(self):
         """Perform any game cleanup here (if needed), then quit()."""
+        if self.profiler is not None:
+            self.profiler.detach()
+            if self.profile_path:
+                self.profiler.export(self.profile_path)
+        if self.publisher is not None:
+            self.publisher.close()
+            self.publisher = None
         pg.mouse.set_visible(True)
         pg.quit()
 
-    def play_minesweeper():
+    def play_minesweeper(board_class=Minesweeper, board_width=BOARD_WIDTH, board_height=BOARD_HEIGHT, profile_path=None,
+                         exit_after_first_frame=False, share_name=None):
         """Static method to play Minesweeper."""
-        game = Game()
+        game = Game(board_class, board_width, board_height, profile_path, exit_after_first_frame, share_name)
         game.run()
 
-    def mouse_to_grid(self, mx: int, my: int, grid_x0, grid_y0, cell_size, grid_width, grid_height):
-        """Convert mouse pixel coordinates (mx, my) to grid coordinates (gx, gy), or None if click outside of board"""
-        if not (grid_x0 <= mx < grid_x0 + cell_size * grid_width # within grid x
-                and grid_y0 <= my < grid_y0 + cell_size * grid_height): # within grid y
-            return None # Clicked outside grid area
-        gx = (mx - grid_x0) // cell_size
-        gy = (my - grid_y0) // cell_size
-        return int(gx), int(gy)
+    def mine_range(self):
+        """Allowed mine counts for the board size: 10-20 on the default 10x10 board,
+        scaled to 10%-20% of the cells otherwise. Always leaves the first click's square free."""
+        cells = self.board_width * self.board_height
+        max_mines = min(cells - 1, max(1, cells // 5))
+        return min(max(1, cells // 10), max_mines), max_mines
+
+    def mouse_to_grid(self, mx: int, my: int, camera):
+        """Convert mouse pixel coordinates (mx, my) to grid coordinates (gx, gy) through the camera, or None if click outside of board"""
+        return camera.screen_to_grid(mx, my)
+
+    def _viewport(self, w, h):
+        """Screen area for the grid: the middle 80% of the window, leaving margins for labels and HUD."""
+        view_w, view_h = int(w * 0.8), int(h * 0.8)
+        return pg.Rect((w - view_w) // 2, (h - view_h) // 2, view_w, view_h)
+
+    def wait_events(self, timeout=None):
+        """Block until input arrives or timeout ms pass (None waits indefinitely). Returns the pending events."""
+        event = pg.event.wait() if timeout is None else pg.event.wait(max(1, timeout))
+        if event.type == pg.NOEVENT: # Timed out
+            return []
+        return [event] + pg.event.get()
+
+    def timer_timeout(self):
+        """Milliseconds until the game timer shows the next second, or None if it is stopped."""
+        if self.start_ticks is None or self.end_time is not None:
+            return None
+        return 1000 - (pg.time.get_ticks() - self.start_ticks) % 1000
+
+    def start_profiling(self, renderer):
+        """Hook the profiler into the board, renderer and display pushes. Returns the profiler."""
+        if self.profiler is None:
+            self.profiler = Profiler()
+        self.profiler.attach(self.minesweeper, BOARD_HOOKS)
+        self.profiler.attach(renderer, RENDERER_HOOKS)
+        self.profiler.attach(pg.display, ("flip", "update"))
+        return self.profiler
+
+    def stop_profiling(self):
+        """Remove the profiler hooks, keeping the collected metrics. Returns None."""
+        self.profiler.detach()
+        return None
 
     def _clamp_size(self, w, h):
         """Clamp window size to minimum dimensions."""
@@ -88,17 +143,19 @@ class Game:
 
     def run(self):
         """Main game loop. Title screen followed by game."""
+        import pygame_textinput as textinput # Only the title screen needs it
         screen = pg.display.set_mode((600, 600), pg.RESIZABLE)
         clock = pg.time.Clock()
 
-        # Load assets, with defaults if loading fails
+        # Load assets, with defaults if loading fails. The fallback is pygame's bundled font:
+        # SysFont would scan every installed font (fc-list) first.
         try:
             font = pg.font.Font(FONT_PATH, 24)
             title_font = pg.font.Font(FONT_PATH, 30)
         except Exception as e:
             print("Custom font failed to load:", e)
-            font = pg.font.SysFont(None, 24)
-            title_font = pg.font.SysFont(None, 30)
+            font = pg.font.Font(None, 24)
+            title_font = pg.font.Font(None, 30)
         try:
             self.cursor_img = pg.image.load(CURSOR_PATH).convert_alpha()
             pg.mouse.set_visible(False) # Hide system cursor, use custom
@@ -118,17 +175,20 @@ class Game:
             self.mine_img = None
 
 
-        # Cap mines at 20 as per requirements. Validator restricts input to 2 digits, 0-20
-        mines_input = textinput.TextInputVisualizer(manager=textinput.TextInputManager(validator=lambda x: (x.isdigit() and int(x) <= 20 and len(x) < 3) or x == ''),
+        # Cap mines at 20 as per requirements (scaled for other board sizes). Validator restricts input to 0-max
+        min_mines, max_mines = self.mine_range()
+        mines_input = textinput.TextInputVisualizer(manager=textinput.TextInputManager(validator=lambda x: (x.isdigit() and int(x) <= max_mines and len(x) <= len(str(max_mines))) or x == ''),
                                                     font_object=font,
                                                     font_color=WHITE,
                                                     cursor_color=WHITE
                                                     )
 
-        # Title screen loop
+        # Title screen loop. Sleeps until input arrives or the text cursor is due to blink.
+        pg.display.set_caption("Minesweeper -- Title Screen")
+        events = []
+        last_blink = pg.time.get_ticks()
         while not self.minesweeper and not self.quit:
             screen.fill(BACKGROUND)
-            pg.display.set_caption("Minesweeper -- Title Screen")
 
             # Responsive layout variables
             w, h = screen.get_size()
@@ -144,13 +204,15 @@ class Game:
             screen.blit(title_text, title_text_rect)
 
             # Render text centered below title
-            mines_text = font.render("Enter Mine Count (10-20): ", True, GENERAL_TEXT)
+            mines_text = font.render(f"Enter Mine Count ({min_mines}-{max_mines}): ", True, GENERAL_TEXT)
             mines_text_rect = mines_text.get_rect(center=(x_center, mine_text_margin))
             screen.blit(mines_text, mines_text_rect)
 
             # Updates mine and render mine-count input field
-            events = pg.event.get()
+            cursor_visible = mines_input.cursor_visible
             mines_input.update(events)
+            if mines_input.cursor_visible != cursor_visible or any(event.type == pg.KEYDOWN for event in events):
+                last_blink = pg.time.get_ticks() # Blink timer restarts on a toggle or key press
             mines_input_rect = mines_input.surface.get_rect(center=(x_center, text_input_margin))
             screen.blit(mines_input.surface, mines_input_rect)
 
@@ -171,10 +233,10 @@ class Game:
                     if (new_w, new_h) != (cur_w, cur_h):
                         screen = pg.display.set_mode((new_w, new_h), pg.RESIZABLE)
                 elif event.type == pg.KEYDOWN and event.key == pg.K_RETURN: # Return/enter key
-                    # Start game if mine count provided and within 10-20 range
-                    if (mines_input.value and 10 <= int(mines_input.value) <= 20):
+                    # Start game if mine count provided and within range (10-20 on 10x10)
+                    if (mines_input.value and min_mines <= int(mines_input.value) <= max_mines):
                         num_mines = int(mines_input.value)
-                        self.start_game(BOARD_WIDTH, BOARD_HEIGHT, num_mines)
+                        self.start_game(self.board_width, self.board_height, num_mines)
 
             # Custom cursor
             if self.cursor_img is not None:
@@ -182,22 +244,36 @@ class Game:
                 screen.blit(self.cursor_img, (mx, my))
 
             pg.display.update()
-            clock.tick(60)
-
-        # Gameplay loop
+            if self.exit_after_first_frame:
+                self.quit = True
+            if self.minesweeper or self.quit:
+                break
+            if events:
+                clock.tick(FRAME_RATE)
+            events = self.wait_events(mines_input.cursor_blink_interval - (pg.time.get_ticks() - last_blink) + 1)
+        if self.quit:
+            self.exit_game()
+            return
+
+        # Gameplay loop. The camera decides which cells are in view and the renderer
+        # keeps the last frame, only redrawing what changed. Between frames the loop
+        # sleeps until input arrives or the timer reaches its next second.
+        camera = Camera(self.minesweeper.width, self.minesweeper.height)
+        renderer = BoardRenderer(self.minesweeper, camera, font, self.mine_img, self.flag_img, self.cursor_img)
+        pg.key.set_repeat(200, 30) # Hold arrow keys to keep panning
+        solver = None # Created on the first hint request, then kept up to date incrementally
+        caption = None
+        # Profiler while F3 is on, None otherwise so the loop skips all timing
+        profiler = self.start_profiling(renderer) if self.profile_path else None
+        overlay = ProfileOverlay(pg.font.Font(None, 18))
+        events = []
         while not self.quit:
-            if not self.minesweeper.is_game_over() and not self.minesweeper.is_game_won():
-                pg.display.set_caption("Minesweeper -- Playing")
-            w, h = screen.get_size()
-            grid_size = min(w, h) * 0.8
-            cell_size = int(grid_size // BOARD_WIDTH)
-            grid_width = BOARD_WIDTH * cell_size
-            grid_height = BOARD_HEIGHT * cell_size
-            grid_x0 = (w - grid_width) // 2
-            grid_y0 = (h - grid_height) // 2
+            if profiler is not None:
+                profiler.begin_frame()
+            camera.set_viewport(self._viewport(*screen.get_size()))
 
             # Handle events
-            for event in pg.event.get():
+            for event in events:
                 if event.type == pg.QUIT:
                     # Safe exit
                     self.quit = True
@@ -207,15 +283,63 @@ class Game:
                     cur_w, cur_h = screen.get_size()
                     if (new_w, new_h) != (cur_w, cur_h):
                         screen = pg.display.set_mode((new_w, new_h), pg.RESIZABLE)
+                    renderer.invalidate()
+                elif event.type == pg.VIDEOEXPOSE: # Window contents lost, push a full frame
+                    renderer.invalidate()
+                elif event.type == pg.MOUSEWHEEL: # Zoom around the cursor
+                    camera.zoom_at(*pg.mouse.get_pos(), ZOOM_STEP ** event.y)
+                elif event.type == pg.MOUSEMOTION and event.buttons[1]: # Middle drag pans
+                    camera.pan(-event.rel[0], -event.rel[1])
+                elif event.type == pg.KEYDOWN and event.key in PAN_KEYS: # Arrow keys/WASD pan
+                    dx, dy = PAN_KEYS[event.key]
+                    step = max(camera.cell_size, camera.viewport.w // 8)
+                    camera.pan(dx * step, dy * step)
+                elif event.type == pg.KEYDOWN and event.key == pg.K_HOME: # Back to whole-board view
+                    camera.fit()
+                elif event.type == pg.KEYDOWN and event.key == pg.K_F3: # Profiling overlay
+                    if profiler is None:
+                        profiler = self.start_profiling(renderer)
+                    else:
+                        profiler = self.stop_profiling()
+                        overlay.hide(renderer)
+                elif event.type == pg.KEYDOWN and event.key == pg.K_h: # Solver hint
+                    if not self.minesweeper.is_game_over() and not self.minesweeper.is_game_won():
+                        if solver is None:
+                            solver = Solver(self.minesweeper.width, self.minesweeper.height, self.minesweeper.num_mines)
+                        solver.update_from_board(self.minesweeper)
+                        renderer.set_hint(solver.hint())
                 elif event.type == pg.MOUSEBUTTONDOWN and self.minesweeper: # Click
-                    hit = self.mouse_to_grid(*event.pos, grid_x0, grid_y0, cell_size, BOARD_WIDTH, BOARD_HEIGHT)
+                    hit = self.mouse_to_grid(*event.pos, camera)
                     if hit is None:
                         continue  # Clicked margin or outside grid
                     grid_x, grid_y = hit
-                    if event.button == 1: # Left click reveal
-                        self.minesweeper.reveal_square(grid_x, grid_y)
+                    if event.button in (1, 3) and renderer.hint is not None: # Board is about to change
+                        renderer.set_hint(None)
+                    if event.button == 1: # Left click reveal, or chord a revealed number
+                        if self.minesweeper.revealed[grid_y][grid_x]:
+                            renderer.mark_cells(self.minesweeper.chord_square(grid_x, grid_y))
+                        else:
+                            renderer.mark_cells(self.minesweeper.reveal_square(grid_x, grid_y))
                     elif event.button == 3: # Right click flag
                         self.minesweeper.toggle_flag(grid_x, grid_y)
+                        renderer.mark_cells([(grid_x, grid_y)])
+            if self.quit:
+                break
+            if profiler is not None:
+                profiler.lap("events")
+
+            # Game end state, freezing the final time once
+            if self.minesweeper.is_game_over(): # Loss
+                end_state, new_caption = "lose", "Minesweeper -- You Lose"
+            elif self.minesweeper.is_game_won(): # Win
+                end_state, new_caption = "win", "Minesweeper -- You Win!"
+            else:
+                end_state, new_caption = None, "Minesweeper -- Playing"
+            if new_caption != caption:
+                pg.display.set_caption(new_caption)
+                caption = new_caption
+            if end_state is not None and self.end_time is None: # Freeze final time
+                self.end_time = (pg.time.get_ticks() - self.start_ticks) // 1000
 
             # Update timer
             if self.start_ticks is not None:
@@ -226,106 +350,19 @@ class Game:
             else:
                 elapsed_seconds = 0
 
-            # Draw the grid
-            screen.fill(BACKGROUND)
-            board = self.minesweeper.get_display_board()
-            for y in range(self.minesweeper.height):
-                for x in range(self.minesweeper.width):
-                    value = board[y][x]
-                    # Determine color and icon of squares
-                    icon = None
-                    if value == -1:
-                        color = MINE_RED
-                        icon_size = int(cell_size * 0.5)
-                        if self.mine_img is not None:
-                            icon = pg.transform.smoothscale(self.mine_img, (icon_size, icon_size))
-                        else: ## Default red if can't load mine image
-                            icon = pg.Surface((icon_size, icon_size))
-                            icon.fill(MINE_RED)
-                    elif value == 0:
-                        color = REVEALED_EMPTY
-                        icon = font.render("0", True, WHITE)
-                    elif value == "?":
-                        color = HIDDEN
-                        icon = None # No icon for hidden squares
-                    elif value == "F":
-                        color = HIDDEN
-                        icon_size = int(cell_size * 0.5)
-                        if self.flag_img is not None:
-                            icon = pg.transform.smoothscale(self.flag_img, (icon_size, icon_size))
-                        else:  # Default black if can't load flag image
-                            icon = pg.Surface((icon_size, icon_size))
-                            icon.fill(BLACK)
-                    else:
-                        color = REVEALED_NUMBER
-                        icon = font.render(str(value), True, WHITE)
-
-                    # Draw cell rectangle and icon if any
-                    cell_rect = pg.Rect(grid_x0 + x * cell_size, grid_y0 + y * cell_size, cell_size, cell_size)
-                    pg.draw.rect(screen, color, cell_rect)
-                    pg.draw.rect(screen, GRID_LINE, cell_rect, 1)  # grid line
-                    if icon is not None:
-                        screen.blit(icon, icon.get_rect(center=cell_rect.center))
-
-            # Draw labels and UI elements
-            # Column labels A–J (top)
-            for col_index, letter in enumerate("ABCDEFGHIJ"):
-                text_surface = font.render(letter, True, GENERAL_TEXT)
-                text_rect = text_surface.get_rect(center=(
-                    grid_x0 + col_index * cell_size + cell_size // 2,
-                    grid_y0 - 20
-                ))
-                screen.blit(text_surface, text_rect)
-
-            # Row labels 1–10 (left)
-            for row_index in range(BOARD_HEIGHT):
-                text_surface = font.render(str(row_index + 1), True, GENERAL_TEXT)
-                text_rect = text_surface.get_rect(center=(
-                    grid_x0 - 20,
-                    grid_y0 + row_index * cell_size + cell_size // 2
-                ))
-                screen.blit(text_surface, text_rect)
-
-            # Timer display
-            time_text = font.render(f"TIME: {elapsed_seconds}", True, GENERAL_TEXT)
-            screen.blit(time_text, (
-                w - time_text.get_width() - 10,
-                h - time_text.get_height() - 10
-            ))
-
-            # Flag Count
-            flag_rect = pg.Rect(w/2, h*12/13, 10, 10)
-            pg.draw.rect(screen, BACKGROUND, flag_rect)
-            flags = font.render(f'Flags Remaining: {str(self.minesweeper.flags_remaining)}', True, WHITE)
-            screen.blit(flags, flags.get_rect(center=flag_rect.center))
-
-            # Game end screen overlay
-            if self.minesweeper.is_game_over(): # Loss
-                pg.display.set_caption("Minesweeper -- You Lose")
-                if self.end_time is None: # Freeze final time
-                    self.end_time = (pg.time.get_ticks() - self.start_ticks) // 1000
-                win_width, win_height = screen.get_size()
-                overlay = pg.Surface((win_width, win_height), pg.SRCALPHA) # Create an overlay surface that allows for transparency
-                overlay.fill(TRANSPARENT_RED, (0, win_height // 2 - 30, win_width, 60))
-                screen.blit(overlay, (0, 0))
-                text = font.render("Game Over", True, BLACK)
-                screen.blit(text, (win_width // 2 - text.get_width() // 2, win_height // 2 - text.get_height() // 2))
-            elif self.minesweeper.is_game_won(): # Win
-                pg.display.set_caption("Minesweeper -- You Win!")
-                if self.end_time is None: # Freeze final time
-                    self.end_time = (pg.time.get_ticks() - self.start_ticks) // 1000
-                win_width, win_height = screen.get_size()
-                overlay = pg.Surface((win_width, win_height), pg.SRCALPHA) # Create an overlay surface that allows for transparency
-                overlay.fill(TRANSPARENT_GREEN, (0, win_height // 2 - 30, win_width, 60))
-                screen.blit(overlay, (0, 0))
-                text = font.render("You Win!", True, BLACK)
-                screen.blit(text, (win_width // 2 - text.get_width() // 2, win_height // 2 - text.get_height() // 2))
-
-            # Custom cursor
-            if self.cursor_img is not None:
-                mx, my = pg.mouse.get_pos()
-                screen.blit(self.cursor_img, (mx, my))
-
-            pg.display.flip()
-            clock.tick(60)
+            if profiler is not None:
+                profiler.lap("state")
+
+            renderer.render(screen, elapsed_seconds, end_state)
+            if self.exit_after_first_frame:
+                break
+            timeout = self.timer_timeout()
+            if profiler is not None:
+                profiler.lap("render")
+                profiler.end_frame()
+                overlay.draw(screen, renderer, profiler.lines())
+                timeout = min(timeout or PROFILE_REFRESH_MS, PROFILE_REFRESH_MS) # Keep the numbers moving
+            if events:
+                clock.tick(FRAME_RATE) # Coalesce bursts of input into at most one frame per tick
+            events = self.wait_events(timeout)
         self.exit_game()
\ No newline at end of file
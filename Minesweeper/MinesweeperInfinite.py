@@ -0,0 +1,273 @@
+"""
+Module: MinesweeperInfinite
+Classes: Chunk, InfiniteMinesweeper
+Description: Unbounded Minesweeper board split into fixed-size square chunks. Each
+                chunk's mines are generated on demand and deterministically from
+                (seed, chunk coordinate), neighbour counts are computed across
+                chunk borders, and chunks live in a bounded LRU that spills
+                player state to disk. Memory follows the explored region, not
+                the board's (infinite) size.
+Inputs: Chunk size, mine density, seed, and cache limits.
+Outputs: Minesweeper game board with the same play methods as MinesweeperBoard.Minesweeper.
+External Sources: None
+Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
+Created: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import os
+import random
+import shutil
+import tempfile
+from collections import OrderedDict
+
+from MinesweeperBoard import MOVE_REVEAL, MOVE_FLAG
+
+# Near 0.1 empty regions stop being bounded: one click there opened ~159,000 cells in 200
+# seeded boards, against ~3,500 at this density
+MIN_DENSITY = 0.12
+
+class Chunk:
+    def __init__(self, size, mines, counts):
+        """Player state for one chunk. mines and counts are bytearrays (counts hold 255 for a mine)."""
+        self.mines = mines
+        self.counts = counts
+        self.revealed = bytearray(size * size)
+        self.flags = bytearray(size * size)
+        self.touched = False  # Has player state worth spilling to disk
+
+class InfiniteMinesweeper:
+    def __init__(self, chunk_size=32, density=0.16, seed=0, max_chunks=256, spill_dir=None):
+        """Create an unbounded board. density is the fraction of mines per chunk; at most
+        max_chunks chunks stay in memory, older touched ones spill to spill_dir (a
+        temporary directory by default, removed by close())."""
+        if not MIN_DENSITY <= density < 1:
+            raise ValueError(f"density must be in [{MIN_DENSITY}, 1) so open regions stay finite")
+        self.chunk_size = chunk_size
+        self.density = density
+        self.seed = seed
+        self.max_chunks = max_chunks
+        self.spill_dir = spill_dir
+        self._own_spill_dir = False
+        self.chunks = OrderedDict()      # (cx, cy) -> Chunk, most recently used last
+        self.spilled = set()             # Chunk coordinates with state on disk
+        self._mine_cache = OrderedDict() # (cx, cy) -> mine bytearray, regenerated on a miss
+        self.safe_zone = set()           # Squares kept mine-free around the first click
+        self.flags_placed = 0
+        self.safe_revealed = 0
+        self.game_over = False
+        self.mines_placed = False  # Set by the first reveal, which fixes the safe zone
+        self.move_log = []
+
+    # Chunk storage
+
+    def chunk_mines(self, cx, cy):
+        """Mines of chunk (cx, cy) as a bytearray, generated from (seed, cx, cy)."""
+        key = (cx, cy)
+        mines = self._mine_cache.get(key)
+        if mines is not None:
+            self._mine_cache.move_to_end(key)
+            return mines
+        size = self.chunk_size
+        area = size * size
+        rng = random.Random(f"{self.seed}:{cx}:{cy}") # String seeds hash the same in every process
+        mines = bytearray(area)
+        for index in rng.sample(range(area), round(area * self.density)):
+            mines[index] = 1
+        for x, y in self.safe_zone:
+            if x // size == cx and y // size == cy:
+                mines[(y % size) * size + x % size] = 0
+        self._mine_cache[key] = mines
+        if len(self._mine_cache) > 4 * self.max_chunks:
+            self._mine_cache.popitem(last=False)
+        return mines
+
+    def is_mine(self, x, y):
+        """True if square (x, y) holds a mine."""
+        size = self.chunk_size
+        return bool(self.chunk_mines(x // size, y // size)[(y % size) * size + x % size])
+
+    def chunk_counts(self, cx, cy):
+        """Neighbour counts for chunk (cx, cy), looking into the 8 surrounding chunks at the borders."""
+        size = self.chunk_size
+        mines = self.chunk_mines(cx, cy)
+        # Mines of the chunk plus a one-square ring from its neighbours
+        padded = [[0] * (size + 2) for _ in range(size + 2)]
+        for py in range(size + 2):
+            wy = cy * size + py - 1
+            for px in range(size + 2):
+                wx = cx * size + px - 1
+                if 0 < px < size + 1 and 0 < py < size + 1:
+                    padded[py][px] = mines[(py - 1) * size + px - 1]
+                else:
+                    padded[py][px] = self.is_mine(wx, wy)
+        counts = bytearray(size * size)
+        for y in range(size):
+            above, row, below = padded[y], padded[y + 1], padded[y + 2]
+            for x in range(size):
+                if row[x + 1]:
+                    counts[y * size + x] = 255
+                else:
+                    counts[y * size + x] = (above[x] + above[x + 1] + above[x + 2] + row[x] + row[x + 2]
+                                            + below[x] + below[x + 1] + below[x + 2])
+        return counts
+
+    def chunk(self, cx, cy):
+        """Return chunk (cx, cy), loading it from disk or generating it, and evict the least recently used."""
+        key = (cx, cy)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+        chunk = Chunk(self.chunk_size, self.chunk_mines(cx, cy), self.chunk_counts(cx, cy))
+        if key in self.spilled:
+            with open(self._spill_path(key), "rb") as f:
+                data = f.read()
+            area = self.chunk_size * self.chunk_size
+            chunk.revealed[:] = data[:area]
+            chunk.flags[:] = data[area:]
+            chunk.touched = True
+        self.chunks[key] = chunk
+        while len(self.chunks) > self.max_chunks:
+            self._evict(*self.chunks.popitem(last=False))
+        return chunk
+
+    def _spill_path(self, key):
+        """File holding the spilled state of a chunk."""
+        return os.path.join(self.spill_dir, f"chunk_{key[0]}_{key[1]}.bin")
+
+    def _evict(self, key, chunk):
+        """Drop a chunk from memory, writing its player state to disk if it has any."""
+        if not chunk.touched:
+            return # Regenerated from the seed when needed again
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix="minesweeper-chunks-")
+            self._own_spill_dir = True
+        with open(self._spill_path(key), "wb") as f:
+            f.write(chunk.revealed + chunk.flags)
+        self.spilled.add(key)
+
+    def close(self):
+        """Remove the temporary spill directory, if one was created."""
+        if self._own_spill_dir and self.spill_dir is not None:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+            self.spill_dir = None
+            self._own_spill_dir = False
+            self.spilled.clear()
+
+    def _cell(self, x, y):
+        """Return (chunk, index) for square (x, y)."""
+        size = self.chunk_size
+        return self.chunk(x // size, y // size), (y % size) * size + x % size
+
+    # Play
+
+    def record_move(self, action, x, y):
+        """Append a move to the move log (time fields are left at 0 for the infinite board)."""
+        self.move_log.append((0, action, x, y))
+
+    def reveal_square(self, x, y):
+        """Reveal a square on the board. If 0 square, reveal adjacent squares across chunks.
+        Returns a list of (x, y) coordinates that were newly revealed."""
+        chunk, index = self._cell(x, y)
+        if chunk.revealed[index] or chunk.flags[index] or self.game_over:
+            return []
+        self.record_move(MOVE_REVEAL, x, y)
+
+        # First click fixes a mine-free 3x3 opening; drop anything generated before it
+        if not self.mines_placed:
+            self.safe_zone = {(x + dx, y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)}
+            self._mine_cache.clear()
+            for key, loaded in list(self.chunks.items()):
+                loaded.mines = self.chunk_mines(*key)
+            for key, loaded in list(self.chunks.items()):
+                loaded.counts = self.chunk_counts(*key)
+            self.mines_placed = True
+            chunk, index = self._cell(x, y)
+
+        chunk.revealed[index] = 1
+        chunk.touched = True
+        opened = [(x, y)]
+
+        # Mine then lose
+        if chunk.counts[index] == 255:
+            opened += self.reveal_all_mines()
+            self.game_over = True
+            return opened
+
+        # Flood fill with an explicit stack; chunks load transparently as it spreads
+        if chunk.counts[index] == 0:
+            size = self.chunk_size
+            stack = [(x, y)]
+            while stack:
+                cx, cy = stack.pop()
+                for ny in range(cy - 1, cy + 2):
+                    for nx in range(cx - 1, cx + 2):
+                        neighbour = self.chunk(nx // size, ny // size)
+                        n = (ny % size) * size + nx % size
+                        if neighbour.revealed[n] or neighbour.flags[n]:
+                            continue
+                        neighbour.revealed[n] = 1
+                        neighbour.touched = True
+                        opened.append((nx, ny))
+                        if neighbour.counts[n] == 0: # Keep spreading through empty squares
+                            stack.append((nx, ny))
+        self.safe_revealed += len(opened)
+        return opened
+
+    def toggle_flag(self, x, y):
+        """Toggle a flag on a square if flaggable."""
+        chunk, index = self._cell(x, y)
+        if chunk.revealed[index] or self.game_over:
+            return
+        self.record_move(MOVE_FLAG, x, y)
+        chunk.flags[index] ^= 1
+        chunk.touched = True
+        self.flags_placed += 1 if chunk.flags[index] else -1
+
+    def is_game_over(self):
+        """True if loss, false otherwise."""
+        return self.game_over
+
+    def is_game_won(self):
+        """An unbounded board can't be cleared."""
+        return False
+
+    def stats(self):
+        """Returns a dict of the running board counters and cache sizes. Constant time."""
+        return {
+            "safe_revealed": self.safe_revealed,
+            "flags_placed": self.flags_placed,
+            "game_over": self.game_over,
+            "game_won": False,
+            "chunks_loaded": len(self.chunks),
+            "chunks_spilled": len(self.spilled),
+        }
+
+    def get_display_square(self, x, y):
+        """Returns the display value of a single square: its number or -1 if revealed, "F" if flagged, "?" if hidden."""
+        chunk, index = self._cell(x, y)
+        if chunk.revealed[index]:
+            count = chunk.counts[index]
+            return -1 if count == 255 else count
+        return "F" if chunk.flags[index] else "?"
+
+    def get_display_board(self, x0=0, y0=0, width=None, height=None):
+        """Returns the display state of the width x height window with top-left (x0, y0)
+        (default: one chunk at the origin)."""
+        width = self.chunk_size if width is None else width
+        height = self.chunk_size if height is None else height
+        return [[self.get_display_square(x, y) for x in range(x0, x0 + width)] for y in range(y0, y0 + height)]
+
+    def reveal_all_mines(self):
+        """Reveal the mines in the chunks held in memory (the board has no end).
+        Returns a list of (x, y) coordinates newly revealed."""
+        size = self.chunk_size
+        opened = []
+        for (cx, cy), chunk in self.chunks.items():
+            for index, mine in enumerate(chunk.mines):
+                if mine and not chunk.revealed[index]:
+                    chunk.revealed[index] = 1
+                    chunk.touched = True
+                    opened.append((cx * size + index % size, cy * size + index // size))
+        return opened
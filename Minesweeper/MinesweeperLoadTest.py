@@ -0,0 +1,204 @@
+"""
+Module: MinesweeperLoadTest
+Functions: player, spectator, run_load_test, main
+Description: Load-test client for MinesweeperServer. Simulates many players making
+                random moves and spectators (optionally slow ones, to exercise
+                backpressure) spread over several rooms, then reports moves per
+                second, move round-trip latency and delta fan-out latency.
+Inputs: Command line arguments (clients, rooms, board, duration, server address).
+Outputs: Summary printed to stdout.
+External Sources: None
+Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
+Created: October 18, 2026
+Last Modified: October 18, 2026
+
+Usage:
+    python Minesweeper/MinesweeperLoadTest.py --players 200 --spectators 200 --rooms 20 --duration 10
+    python Minesweeper/MinesweeperLoadTest.py --connect 127.0.0.1:8765 --players 100
+
+Without --connect a server is started in this process on a free localhost port.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from itertools import count
+
+from MinesweeperProfiler import percentile
+from MinesweeperServer import MinesweeperServer, QUEUE_SIZE
+from MinesweeperSimulation import board_class_for
+
+class LoadStats:
+    def __init__(self):
+        """Counters and latency samples (seconds) shared by all simulated clients."""
+        self.moves = 0
+        self.deltas = 0
+        self.snapshots = 0
+        self.errors = 0
+        self.move_latency = []    # Player's move sent -> its delta or ack received
+        self.fanout_latency = []  # Move sent -> delta received, by every client in the room
+
+    def receive(self, message, now):
+        """Count an incoming message and record the fan-out latency of deltas."""
+        kind = message["type"]
+        if kind == "delta":
+            self.deltas += 1
+            if message.get("t") is not None:
+                self.fanout_latency.append(now - message["t"])
+        elif kind == "snapshot":
+            self.snapshots += 1
+        elif kind == "error":
+            self.errors += 1
+
+def _line_limit(board):
+    """Reader line limit that fits a snapshot of board. Not STREAM_LIMIT: a StreamReader reads
+    ahead up to twice its limit, which would hide a slow spectator from the server."""
+    width, height, _ = board
+    return max(1 << 16, 2 * width * height)
+
+async def _send(writer, message):
+    """Write one JSON line."""
+    writer.write((json.dumps(message) + "\n").encode())
+    await writer.drain()
+
+async def _messages(reader, deadline):
+    """Yield decoded messages until the connection closes or the deadline passes."""
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return
+        try:
+            line = await asyncio.wait_for(reader.readline(), remaining)
+        except asyncio.TimeoutError:
+            return
+        if not line:
+            return
+        yield json.loads(line)
+
+async def player(host, port, room, board, stats, deadline, seed):
+    """Join room and keep making random moves, one at a time, until the deadline."""
+    width, height, mines = board
+    reader, writer = await asyncio.open_connection(host, port, limit=_line_limit(board))
+    rng = random.Random(seed)
+    ids = count()
+    rows = None
+    me = None
+    over = False
+    waiting = None  # (move id, time sent), or "new" while a reset is pending
+    await _send(writer, {"op": "join", "room": room, "role": "player", "width": width, "height": height, "mines": mines})
+    try:
+        async for message in _messages(reader, deadline):
+            now = time.time()
+            stats.receive(message, now)
+            kind = message["type"]
+            if kind == "snapshot":
+                rows = [list(row) for row in message["rows"]]
+                me = message["you"]
+                over = message["game_over"] or message["game_won"]
+                waiting = None # A resync or new board supersedes whatever was in flight
+            elif kind == "delta":
+                for x, y, code in message["cells"]:
+                    rows[y][x] = code
+                over = message["game_over"] or message["game_won"]
+                if waiting not in (None, "new") and message["by"] == me and message["id"] == waiting[0]:
+                    stats.move_latency.append(now - waiting[1])
+                    stats.moves += 1
+                    waiting = None
+            elif kind == "ack" and waiting not in (None, "new") and message["id"] == waiting[0]:
+                stats.move_latency.append(now - waiting[1])
+                stats.moves += 1
+                waiting = None
+
+            if waiting is not None or rows is None:
+                continue
+            if over:
+                await _send(writer, {"op": "new"})
+                waiting = "new"
+                continue
+            hidden = [(x, y) for y, row in enumerate(rows) for x, code in enumerate(row) if code == "?"]
+            if not hidden:
+                continue
+            x, y = rng.choice(hidden)
+            move_id = next(ids)
+            waiting = (move_id, time.time())
+            await _send(writer, {"op": "flag" if rng.random() < 0.05 else "reveal", "x": x, "y": y,
+                                 "id": move_id, "t": waiting[1]})
+    finally:
+        writer.close()
+
+async def spectator(host, port, room, board, stats, deadline, delay=0.0):
+    """Join room as a spectator and read until the deadline, sleeping delay seconds per message."""
+    reader, writer = await asyncio.open_connection(host, port, limit=_line_limit(board))
+    await _send(writer, {"op": "join", "room": room, "role": "spectator"})
+    try:
+        async for message in _messages(reader, deadline):
+            stats.receive(message, time.time())
+            if delay:
+                await asyncio.sleep(delay) # Slow reader: the server's queue for us fills up
+    finally:
+        writer.close()
+
+async def run_load_test(players, spectators, rooms, board, duration, connect=None, slow_spectators=0,
+                        slow_delay=0.05, engine="list", queue_size=QUEUE_SIZE):
+    """Run the simulated clients against a server and return (stats, seconds, server or None)."""
+    server = None
+    if connect is None:
+        server = MinesweeperServer(board_class_for(engine), queue_size)
+        listener = await server.start("127.0.0.1", 0)
+        host, port = listener.sockets[0].getsockname()[:2]
+    else:
+        host, port = connect
+    stats = LoadStats()
+    start = time.time()
+    deadline = start + duration
+    tasks = [player(host, port, f"room-{i % rooms}", board, stats, deadline, i) for i in range(players)]
+    tasks += [spectator(host, port, f"room-{i % rooms}", board, stats, deadline, slow_delay if i < slow_spectators else 0.0)
+              for i in range(spectators)]
+    await asyncio.gather(*tasks)
+    elapsed = time.time() - start
+    if server is not None:
+        listener.close()
+        await server.close() # Also tallies the overflows of clients still connected
+        await listener.wait_closed()
+    return stats, elapsed, server
+
+def _latency(samples):
+    """p50/p95/p99 of latency samples, formatted in milliseconds."""
+    ordered = sorted(samples)
+    return " ".join(f"p{p} {percentile(ordered, p) * 1000:.2f}" for p in (50, 95, 99)) + " ms"
+
+def main(argv=None):
+    """Parse command line arguments, run the load test and print a summary."""
+    parser = argparse.ArgumentParser(description="Load test for the Minesweeper server")
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--spectators", type=int, default=200)
+    parser.add_argument("--rooms", type=int, default=20)
+    parser.add_argument("--width", type=int, default=30)
+    parser.add_argument("--height", type=int, default=16)
+    parser.add_argument("--mines", type=int, default=40)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--slow-spectators", type=int, default=0, help="spectators that read slowly")
+    parser.add_argument("--slow-delay", type=float, default=0.05, help="seconds a slow spectator spends per message")
+    parser.add_argument("--connect", metavar="HOST:PORT", help="use a running server instead of an in-process one")
+    parser.add_argument("--engine", choices=("list", "numpy"), default="list", help="board engine of the in-process server")
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE, help="per-client queue of the in-process server")
+    args = parser.parse_args(argv)
+    connect = None
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        connect = (host, int(port))
+
+    stats, elapsed, server = asyncio.run(run_load_test(
+        args.players, args.spectators, args.rooms, (args.width, args.height, args.mines), args.duration,
+        connect, args.slow_spectators, args.slow_delay, args.engine, args.queue_size))
+    print(f"{args.players} players, {args.spectators} spectators, {args.rooms} rooms, {elapsed:.1f}s")
+    print(f"moves:   {stats.moves} ({stats.moves / elapsed:.0f}/s), round trip {_latency(stats.move_latency)}")
+    print(f"fan-out: {stats.deltas} deltas received, {_latency(stats.fanout_latency)}")
+    print(f"snapshots received: {stats.snapshots}, errors: {stats.errors}")
+    if server is not None:
+        print(f"slow clients resynced: {server.overflows} times")
+
+if __name__ == "__main__":
+    main()
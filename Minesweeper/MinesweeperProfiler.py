@@ -0,0 +1,181 @@
+"""
+Module: MinesweeperProfiler
+Classes: Profiler
+Functions: percentile
+Description: Frame-time and hot-path profiling. Keeps rolling windows of frame
+                times and per-phase timings from the game loop, and times calls
+                to hooked methods (board, renderer, or any object) by wrapping
+                them in place. Nothing is wrapped until attach() is called, and
+                detach() puts the original methods back, so profiling costs
+                nothing while it is off.
+Inputs: Phase laps from the game loop and objects whose methods should be timed.
+Outputs: Percentile summaries, overlay text lines, and CSV/JSON exports.
+External Sources: None
+Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
+Created: October 18, 2026
+Last Modified: October 18, 2026
+
+Usage:
+    profiler = Profiler()
+    profiler.attach(board, BOARD_HOOKS)
+    board.reveal_square(0, 0)
+    profiler.export("profile.csv")
+    profiler.detach()
+"""
+
+import csv
+import json
+from collections import deque
+from time import perf_counter
+
+# Board methods timed by default
+BOARD_HOOKS = ("reveal_square", "calculate_squares", "place_mines", "get_display_board")
+
+# Frames kept for the rolling percentiles
+WINDOW = 240
+
+# Columns of the CSV export
+CSV_FIELDS = ("section", "name", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms", "total_ms")
+
+_MISSING = object()
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile p (0-100) of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+def _sample_stats(values):
+    """Summary of a window of durations in seconds, in milliseconds."""
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "mean_ms": sum(ordered) / len(ordered) * 1000 if ordered else 0.0,
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p95_ms": percentile(ordered, 95) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+        "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+    }
+
+class Profiler:
+    def __init__(self, window=WINDOW):
+        """Create a profiler keeping the last window frames."""
+        self.window = window
+        self.frames = deque(maxlen=window)  # Whole-frame durations (s), idle waiting excluded
+        self.phases = {}                    # Phase name -> deque of durations (s)
+        self.calls = {}                     # Hook name -> [count, total s, max s]
+        self._attached = []                 # (object, method name, original own attribute or _MISSING)
+        self._frame_start = None
+        self._lap = None
+
+    # Game loop phases
+
+    def begin_frame(self):
+        """Start timing a frame."""
+        self._frame_start = self._lap = perf_counter()
+
+    def lap(self, phase):
+        """Charge the time since the last lap (or frame start) to phase."""
+        if self._lap is None: # Profiling started mid-frame
+            return
+        now = perf_counter()
+        samples = self.phases.get(phase)
+        if samples is None:
+            samples = self.phases[phase] = deque(maxlen=self.window)
+        samples.append(now - self._lap)
+        self._lap = now
+
+    def end_frame(self):
+        """Finish the frame started by begin_frame."""
+        if self._frame_start is not None:
+            self.frames.append(perf_counter() - self._frame_start)
+        self._frame_start = self._lap = None
+
+    # Method hooks
+
+    def attach(self, obj, names):
+        """Time calls to obj's methods names (an instance, class or module). Only obj is
+        affected: the wrappers are set as its own attributes until detach()."""
+        owner = getattr(obj, "__name__", None) or type(obj).__name__
+        for name in names:
+            method = getattr(obj, name)
+            stats = self.calls.setdefault(f"{owner}.{name}", [0, 0.0, 0.0])
+
+            def timed(*args, _method=method, _stats=stats, **kwargs):
+                start = perf_counter()
+                try:
+                    return _method(*args, **kwargs)
+                finally:
+                    elapsed = perf_counter() - start
+                    _stats[0] += 1
+                    _stats[1] += elapsed
+                    if elapsed > _stats[2]:
+                        _stats[2] = elapsed
+
+            self._attached.append((obj, name, vars(obj).get(name, _MISSING)))
+            setattr(obj, name, timed)
+
+    def detach(self, obj=None):
+        """Restore the original methods of obj, or of everything attached if obj is None."""
+        kept = []
+        for attached in reversed(self._attached): # Undo in reverse so repeated hooks unwind cleanly
+            target, name, original = attached
+            if obj is not None and target is not obj:
+                kept.append(attached)
+            elif original is _MISSING:
+                delattr(target, name) # Falls back to the class method
+            else:
+                setattr(target, name, original)
+        self._attached = kept[::-1]
+
+    @property
+    def attached(self):
+        """True while any hooks are installed."""
+        return bool(self._attached)
+
+    # Reporting
+
+    def summary(self):
+        """Returns a dict of frame, phase and hook statistics (times in milliseconds)."""
+        calls = {}
+        for name, (count, total, longest) in self.calls.items():
+            calls[name] = {
+                "count": count,
+                "mean_ms": total / count * 1000 if count else 0.0,
+                "max_ms": longest * 1000,
+                "total_ms": total * 1000,
+            }
+        return {
+            "frames": _sample_stats(self.frames),
+            "phases": {name: _sample_stats(samples) for name, samples in self.phases.items()},
+            "calls": calls,
+        }
+
+    def lines(self):
+        """Short text lines for the in-game overlay."""
+        summary = self.summary()
+        frames = summary["frames"]
+        lines = [f"frame p50 {frames['p50_ms']:.2f} p95 {frames['p95_ms']:.2f} p99 {frames['p99_ms']:.2f} ms",
+                 f"      max {frames['max_ms']:.2f} ms over {frames['count']} frames"]
+        for name, stats in summary["phases"].items():
+            lines.append(f"{name:<8} mean {stats['mean_ms']:.2f} p95 {stats['p95_ms']:.2f} ms")
+        for name, stats in summary["calls"].items():
+            if stats["count"]:
+                lines.append(f"{name.split('.')[-1]:<18} x{stats['count']} mean {stats['mean_ms']:.2f} ms")
+        return lines
+
+    def export(self, path):
+        """Write the summary to path: JSON if it ends in .json, CSV with one row per metric otherwise."""
+        summary = self.summary()
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump(summary, f, indent=2)
+            return
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerow({"section": "frames", "name": "frame", **summary["frames"]})
+            for section in ("phases", "calls"):
+                for name, stats in summary[section].items():
+                    writer.writerow({"section": section, "name": name, **stats})
@@ -0,0 +1,472 @@
+"""
+Module: MinesweeperRenderer
+Classes: TileAtlas, Camera, BoardRenderer, ProfileOverlay
+Description: Incremental renderer for the gameplay screen. Keeps the board, labels
+                and HUD on an off-screen surface, redraws only the cells that
+                changed since the last frame, and pushes just those regions to
+                the display with pg.display.update(rects). Cell tiles and text
+                are pre-rendered into an atlas so each cell is a single blit.
+                A pan/zoom camera limits drawing to the cells in view, so frame
+                cost depends on window size rather than board size.
+Inputs: Minesweeper board, camera, fonts and icon images from the game loop.
+Outputs: Drawn gameplay frames.
+External Sources: Pygame
+Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
+Created: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import math
+from collections import OrderedDict
+
+import pygame as pg
+
+# Colors (RGB), shared with MinesweeperGame
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GRID_LINE = (255, 255, 255)
+HIDDEN = (247, 225, 215)
+REVEALED_EMPTY = (222, 219, 210)
+REVEALED_NUMBER = (176, 196, 177)
+MINE_RED = (219, 110, 110)
+BACKGROUND = (74, 87, 89)
+TITLE_TEXT = (240, 228, 220)
+GENERAL_TEXT = (176, 196, 177)
+TRANSPARENT_RED = (255, 155, 155, 180)
+TRANSPARENT_GREEN = (155, 255, 155, 200)
+HINT_SAFE = (90, 170, 90)
+HINT_RISKY = (230, 160, 60)
+PROFILE_PANEL = (0, 0, 0, 170)
+
+# Zoom limits in pixels per cell
+MIN_CELL_SIZE = 6
+MAX_CELL_SIZE = 96
+
+# Atlas tile keys, in strip order: digits 0-8, mine, flag, hidden
+TILE_KEYS = (0, 1, 2, 3, 4, 5, 6, 7, 8, -1, "F", "?")
+
+class TileAtlas:
+    def __init__(self, font, mine_img=None, flag_img=None, max_sizes=4, max_texts=256):
+        """Pre-rendered cell tiles and text surfaces. Tiles are built once per cell size
+        and kept in a small LRU so resizing back and forth doesn't rebuild them."""
+        self.font = font
+        self.mine_img = mine_img
+        self.flag_img = flag_img
+        self.max_sizes = max_sizes
+        self.max_texts = max_texts
+        self.sizes = OrderedDict()  # cell_size -> (atlas surface, {tile key: area rect})
+        self.texts = OrderedDict()  # (text, color) -> rendered surface
+
+    def tiles(self, cell_size):
+        """Return (surface, areas) for a cell size, building it on a miss."""
+        entry = self.sizes.get(cell_size)
+        if entry is None:
+            entry = self.build(cell_size)
+            self.sizes[cell_size] = entry
+            if len(self.sizes) > self.max_sizes:
+                self.sizes.popitem(last=False) # Drop least recently used size
+        else:
+            self.sizes.move_to_end(cell_size)
+        return entry
+
+    def build(self, cell_size):
+        """Render every tile for one cell size side by side into a single surface."""
+        atlas = pg.Surface((cell_size * len(TILE_KEYS), cell_size))
+        areas = {}
+        icon_size = int(cell_size * 0.5)
+        for index, key in enumerate(TILE_KEYS):
+            # Determine color and icon of squares
+            icon = None
+            if key == -1:
+                color = MINE_RED
+                if self.mine_img is not None:
+                    icon = pg.transform.smoothscale(self.mine_img, (icon_size, icon_size))
+                else: ## Default red if can't load mine image
+                    icon = pg.Surface((icon_size, icon_size))
+                    icon.fill(MINE_RED)
+            elif key == 0:
+                color = REVEALED_EMPTY
+                icon = self.font.render("0", True, WHITE)
+            elif key == "?":
+                color = HIDDEN
+                icon = None # No icon for hidden squares
+            elif key == "F":
+                color = HIDDEN
+                if self.flag_img is not None:
+                    icon = pg.transform.smoothscale(self.flag_img, (icon_size, icon_size))
+                else:  # Default black if can't load flag image
+                    icon = pg.Surface((icon_size, icon_size))
+                    icon.fill(BLACK)
+            else:
+                color = REVEALED_NUMBER
+                icon = self.font.render(str(key), True, WHITE)
+
+            # Draw cell rectangle and icon if any
+            area = pg.Rect(index * cell_size, 0, cell_size, cell_size)
+            pg.draw.rect(atlas, color, area)
+            pg.draw.rect(atlas, GRID_LINE, area, 1)  # grid line
+            if icon is not None:
+                atlas.set_clip(area) # Keep oversized icons out of the neighbouring tile
+                atlas.blit(icon, icon.get_rect(center=area.center))
+                atlas.set_clip(None)
+            areas[key] = area
+        return atlas, areas
+
+    def text(self, text, color):
+        """Return a rendered text surface, cached by text and color."""
+        key = (text, color)
+        surface = self.texts.get(key)
+        if surface is None:
+            surface = self.font.render(text, True, color)
+            self.texts[key] = surface
+            if len(self.texts) > self.max_texts:
+                self.texts.popitem(last=False)
+        else:
+            self.texts.move_to_end(key)
+        return surface
+
+def column_label(index):
+    """Spreadsheet-style column name: 0 -> A, 25 -> Z, 26 -> AA."""
+    label = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        label = chr(ord("A") + remainder) + label
+    return label
+
+class Camera:
+    def __init__(self, board_width, board_height):
+        """Scrollable, zoomable view onto a board_width x board_height grid."""
+        self.board_width = board_width
+        self.board_height = board_height
+        self.viewport = pg.Rect(0, 0, 0, 0)  # Screen area the grid is drawn in
+        self.cell_size = MIN_CELL_SIZE
+        self.offset_x = 0  # Grid pixel shown at the viewport's top-left,
+        self.offset_y = 0  # negative when the grid is centered inside it
+        self.fitted = True  # Follow the window size until the player zooms
+
+    def set_viewport(self, viewport):
+        """Set the screen area for the grid, refitting or clamping the view."""
+        viewport = pg.Rect(viewport)
+        if viewport == self.viewport:
+            return
+        self.viewport = viewport
+        if self.fitted:
+            self.fit()
+        else:
+            self.clamp()
+
+    def fit(self):
+        """Zoom so the whole board fits the viewport (down to the minimum cell size)."""
+        self.fitted = True
+        self.cell_size = max(MIN_CELL_SIZE, min(self.viewport.w // self.board_width, self.viewport.h // self.board_height))
+        # Start centered on the board
+        self.offset_x = (self.board_width * self.cell_size - self.viewport.w) // 2
+        self.offset_y = (self.board_height * self.cell_size - self.viewport.h) // 2
+        self.clamp()
+
+    def clamp(self):
+        """Keep the board in view: center it on an axis where it fits, otherwise stop at its edges."""
+        grid_w = self.board_width * self.cell_size
+        grid_h = self.board_height * self.cell_size
+        if grid_w <= self.viewport.w:
+            self.offset_x = -((self.viewport.w - grid_w) // 2)
+        else:
+            self.offset_x = min(max(self.offset_x, 0), grid_w - self.viewport.w)
+        if grid_h <= self.viewport.h:
+            self.offset_y = -((self.viewport.h - grid_h) // 2)
+        else:
+            self.offset_y = min(max(self.offset_y, 0), grid_h - self.viewport.h)
+
+    def pan(self, dx, dy):
+        """Scroll the view by (dx, dy) screen pixels."""
+        self.offset_x += int(dx)
+        self.offset_y += int(dy)
+        self.clamp()
+
+    def zoom_at(self, mx, my, factor):
+        """Zoom by factor, keeping the grid point under screen position (mx, my) fixed."""
+        new_size = int(round(self.cell_size * factor))
+        if new_size == self.cell_size: # Always move at least one pixel per step
+            new_size += 1 if factor > 1 else -1
+        new_size = min(max(new_size, MIN_CELL_SIZE), MAX_CELL_SIZE)
+        if new_size == self.cell_size:
+            return
+        px = mx - self.viewport.x
+        py = my - self.viewport.y
+        self.offset_x = int((self.offset_x + px) * new_size / self.cell_size) - px
+        self.offset_y = int((self.offset_y + py) * new_size / self.cell_size) - py
+        self.cell_size = new_size
+        self.fitted = False
+        self.clamp()
+
+    def origin(self):
+        """Screen position of the grid's top-left corner."""
+        return self.viewport.x - self.offset_x, self.viewport.y - self.offset_y
+
+    def visible_range(self):
+        """Cells intersecting the viewport as (x0, x1, y0, y1), end-exclusive."""
+        cell_size = self.cell_size
+        x0 = max(0, self.offset_x // cell_size)
+        y0 = max(0, self.offset_y // cell_size)
+        x1 = min(self.board_width, -(-(self.offset_x + self.viewport.w) // cell_size))
+        y1 = min(self.board_height, -(-(self.offset_y + self.viewport.h) // cell_size))
+        return x0, x1, y0, y1
+
+    def cell_rect(self, x, y):
+        """Screen rect of a grid cell."""
+        grid_x0, grid_y0 = self.origin()
+        return pg.Rect(grid_x0 + x * self.cell_size, grid_y0 + y * self.cell_size, self.cell_size, self.cell_size)
+
+    def screen_to_grid(self, mx, my):
+        """Convert screen pixel coordinates to grid coordinates (gx, gy), or None if outside the board."""
+        if not self.viewport.collidepoint(mx, my):
+            return None # Clicked margin
+        grid_x0, grid_y0 = self.origin()
+        gx = (mx - grid_x0) // self.cell_size
+        gy = (my - grid_y0) // self.cell_size
+        if not (0 <= gx < self.board_width and 0 <= gy < self.board_height):
+            return None # Clicked viewport area around a small board
+        return int(gx), int(gy)
+
+    def state(self):
+        """Hashable snapshot of the view, to detect pans, zooms and resizes."""
+        return (tuple(self.viewport), self.cell_size, self.offset_x, self.offset_y)
+
+class BoardRenderer:
+    def __init__(self, minesweeper, camera, font, mine_img=None, flag_img=None, cursor_img=None):
+        """Create a renderer for the given board and camera using the game's font and icon images."""
+        self.minesweeper = minesweeper
+        self.camera = camera
+        self.cursor_img = cursor_img
+        self.atlas = TileAtlas(font, mine_img, flag_img)
+        self.frame = None        # Off-screen copy of everything on screen except the cursor
+        self.view = None         # Camera state the frame was drawn with
+        self.end_state = None    # "win", "lose" or None, to redraw the overlay once
+        self.full_redraw = True
+        self.dirty_cells = set()
+        self.text_rects = {}     # HUD slot -> (text, rect) last drawn
+        self.cursor_rect = None  # Where the cursor was last drawn on screen
+        self.hint = None         # (x, y, mine probability) from the solver, outlined until the board changes
+
+    def invalidate(self):
+        """Force the next render to redraw and flip the whole window (resize, expose)."""
+        self.full_redraw = True
+
+    def set_hint(self, hint):
+        """Outline the (x, y, probability) hint cell, or clear it with None."""
+        if self.hint is not None:
+            self.dirty_cells.add(self.hint[:2])
+        self.hint = hint
+        if hint is not None:
+            self.dirty_cells.add(hint[:2])
+
+    def mark_cells(self, cells):
+        """Queue (x, y) cells changed by the last reveal or flag for redraw."""
+        self.dirty_cells.update((int(x), int(y)) for x, y in cells)
+
+    def draw_cell(self, x, y):
+        """Draw one cell onto the off-screen frame with a single atlas blit and return
+        its on-screen rect, or None if the cell is out of view."""
+        cell_rect = self.camera.cell_rect(x, y).clip(self.camera.viewport)
+        if not cell_rect:
+            return None
+        atlas, areas = self.atlas.tiles(self.camera.cell_size)
+        self.frame.set_clip(self.camera.viewport) # Edge cells are partly scrolled out
+        self.frame.blit(atlas, self.camera.cell_rect(x, y), areas[self.minesweeper.get_display_square(x, y)])
+        if self.hint is not None and self.hint[:2] == (x, y):
+            self.draw_hint_outline()
+        self.frame.set_clip(None)
+        return cell_rect
+
+    def draw_hint_outline(self):
+        """Outline the hint cell, green if proven safe, orange if it is a guess."""
+        x, y, probability = self.hint
+        color = HINT_SAFE if probability == 0 else HINT_RISKY
+        pg.draw.rect(self.frame, color, self.camera.cell_rect(x, y), max(2, self.camera.cell_size // 12))
+
+    def draw_labels(self):
+        """Draw column letters and row numbers for the visible part of the grid."""
+        camera = self.camera
+        cell_size = camera.cell_size
+        x0, x1, y0, y1 = camera.visible_range()
+        grid_x0, grid_y0 = camera.origin()
+        label_y = max(grid_y0, camera.viewport.top) - 20
+        label_x = max(grid_x0, camera.viewport.left) - 20
+        # Skip labels when zoomed out far enough that they would overlap
+        widest = self.atlas.text(column_label(camera.board_width - 1), GENERAL_TEXT).get_width()
+        col_step = max(1, math.ceil((widest + 6) / cell_size))
+        row_step = max(1, math.ceil((self.atlas.text("0", GENERAL_TEXT).get_height() + 2) / cell_size))
+
+        # Column labels A, B, ... (top)
+        for col_index in range(x0 + (-x0) % col_step, x1, col_step):
+            text_surface = self.atlas.text(column_label(col_index), GENERAL_TEXT)
+            text_rect = text_surface.get_rect(center=(
+                grid_x0 + col_index * cell_size + cell_size // 2,
+                label_y
+            ))
+            self.frame.blit(text_surface, text_rect)
+
+        # Row labels 1, 2, ... (left)
+        for row_index in range(y0 + (-y0) % row_step, y1, row_step):
+            text_surface = self.atlas.text(str(row_index + 1), GENERAL_TEXT)
+            text_rect = text_surface.get_rect(center=(
+                label_x,
+                grid_y0 + row_index * cell_size + cell_size // 2
+            ))
+            self.frame.blit(text_surface, text_rect)
+
+    def draw_text(self, slot, text, color, place):
+        """Draw HUD text into a named slot if it changed. place(surface) returns the
+        surface's rect. Returns the rect that needs pushing to the display, or None."""
+        previous = self.text_rects.get(slot)
+        if previous is not None and previous[0] == text:
+            return None
+        surface = self.atlas.text(text, color)
+        rect = place(surface)
+        dirty = rect
+        if previous is not None: # Clear the old text, it may have been wider
+            self.frame.fill(BACKGROUND, previous[1])
+            dirty = rect.union(previous[1])
+        self.frame.blit(surface, rect)
+        self.text_rects[slot] = (text, rect)
+        return dirty
+
+    def draw_hud(self, elapsed_seconds):
+        """Draw timer and flag count. Returns the list of changed rects."""
+        w, h = self.frame.get_size()
+        # Timer display
+        timer = self.draw_text("timer", f"TIME: {elapsed_seconds}", GENERAL_TEXT,
+                               lambda s: s.get_rect(topleft=(w - s.get_width() - 10, h - s.get_height() - 10)))
+        # Flag Count
+        flag_center = pg.Rect(w/2, h*12/13, 10, 10).center
+        flags = self.draw_text("flags", f'Flags Remaining: {str(self.minesweeper.flags_remaining)}', WHITE,
+                               lambda s: s.get_rect(center=flag_center))
+        # Solver hint
+        hint_text = ""
+        if self.hint is not None:
+            x, y, probability = self.hint
+            odds = "safe" if probability == 0 else f"{probability:.0%} mine"
+            hint_text = f"Hint: {column_label(x)}{y + 1} ({odds})"
+        hint = self.draw_text("hint", hint_text, GENERAL_TEXT, lambda s: s.get_rect(center=(w // 2, h // 40)))
+        return [rect for rect in (timer, flags, hint) if rect is not None]
+
+    def draw_overlay(self):
+        """Draw the win/loss banner across the middle of the frame."""
+        win_width, win_height = self.frame.get_size()
+        overlay = pg.Surface((win_width, win_height), pg.SRCALPHA) # Create an overlay surface that allows for transparency
+        fill, message = (TRANSPARENT_RED, "Game Over") if self.end_state == "lose" else (TRANSPARENT_GREEN, "You Win!")
+        overlay.fill(fill, (0, win_height // 2 - 30, win_width, 60))
+        self.frame.blit(overlay, (0, 0))
+        text = self.atlas.text(message, BLACK)
+        self.frame.blit(text, (win_width // 2 - text.get_width() // 2, win_height // 2 - text.get_height() // 2))
+
+    def redraw_frame(self, size, elapsed_seconds):
+        """Redraw the whole off-screen frame from the board."""
+        if self.frame is None or self.frame.get_size() != size:
+            self.frame = pg.Surface(size)
+        self.frame.fill(BACKGROUND)
+        # Only cells intersecting the viewport are drawn
+        x0, x1, y0, y1 = self.camera.visible_range()
+        atlas, areas = self.atlas.tiles(self.camera.cell_size)
+        get_display_square = self.minesweeper.get_display_square
+        self.frame.set_clip(self.camera.viewport)
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                self.frame.blit(atlas, self.camera.cell_rect(x, y), areas[get_display_square(x, y)])
+        if self.hint is not None:
+            self.draw_hint_outline()
+        self.frame.set_clip(None)
+        self.draw_labels()
+        self.text_rects.clear()
+        self.draw_hud(elapsed_seconds)
+        if self.end_state is not None:
+            self.draw_overlay()
+        self.dirty_cells.clear()
+
+    def render(self, screen, elapsed_seconds, end_state=None):
+        """Bring the screen up to date, pushing only regions that changed."""
+        if end_state != self.end_state or (end_state is not None and self.dirty_cells):
+            # Overlay covers cells, so redraw everything under it
+            self.end_state = end_state
+            self.full_redraw = True
+
+        x0, x1, y0, y1 = self.camera.visible_range()
+        if len(self.dirty_cells) > (x1 - x0) * (y1 - y0): # Big cascade, cheaper to redraw the view
+            self.full_redraw = True
+        if self.camera.state() != self.view: # Panned, zoomed or resized
+            self.view = self.camera.state()
+            self.full_redraw = True
+
+        if self.full_redraw or self.frame is None or self.frame.get_size() != screen.get_size():
+            self.redraw_frame(screen.get_size(), elapsed_seconds)
+            screen.blit(self.frame, (0, 0))
+            self.cursor_rect = self.draw_cursor(screen)
+            pg.display.flip()
+            self.full_redraw = False
+            return
+
+        rects = []
+        for x, y in self.dirty_cells:
+            if x0 <= x < x1 and y0 <= y < y1: # Off-screen cells are drawn when scrolled into view
+                rects.append(self.draw_cell(x, y))
+        self.dirty_cells.clear()
+        rects += self.draw_hud(elapsed_seconds)
+
+        # Custom cursor: restore what was under it and draw it at the new position
+        if self.cursor_img is not None:
+            new_cursor = self.cursor_img.get_rect(topleft=pg.mouse.get_pos())
+            if new_cursor != self.cursor_rect or rects:
+                if self.cursor_rect is not None:
+                    rects.append(self.cursor_rect)
+                rects.append(new_cursor)
+
+        if not rects:
+            return # Nothing changed, leave the display alone
+        for rect in rects:
+            screen.blit(self.frame, rect, rect)
+        self.cursor_rect = self.draw_cursor(screen)
+        pg.display.update(rects)
+
+    def draw_cursor(self, screen):
+        """Draw the custom cursor on screen. Returns its rect, or None if not in use."""
+        if self.cursor_img is None:
+            return None
+        mx, my = pg.mouse.get_pos()
+        return screen.blit(self.cursor_img, (mx, my))
+
+class ProfileOverlay:
+    def __init__(self, font):
+        """Profiler text panel drawn straight onto the screen in the top-left corner,
+        on top of the renderer's frame."""
+        self.font = font
+        self.rect = None  # Screen area covered by the last panel
+
+    def draw(self, screen, renderer, lines):
+        """Draw the panel with the given text lines and push the changed area."""
+        surfaces = [self.font.render(line, True, WHITE) for line in lines]
+        pad = 6
+        panel = pg.Surface((max(s.get_width() for s in surfaces) + 2 * pad,
+                            sum(s.get_height() for s in surfaces) + 2 * pad), pg.SRCALPHA)
+        panel.fill(PROFILE_PANEL)
+        y = pad
+        for surface in surfaces:
+            panel.blit(surface, (pad, y))
+            y += surface.get_height()
+        rect = panel.get_rect(topleft=(8, 8))
+
+        # Restore the frame under the old panel (and the cursor, which goes back on top)
+        dirty = rect if self.rect is None else rect.union(self.rect)
+        if renderer.cursor_rect is not None and renderer.cursor_rect.colliderect(dirty):
+            dirty = dirty.union(renderer.cursor_rect)
+        screen.blit(renderer.frame, dirty, dirty)
+        screen.blit(panel, rect)
+        if renderer.cursor_rect is not None and renderer.cursor_rect.colliderect(dirty):
+            renderer.cursor_rect = renderer.draw_cursor(screen)
+        pg.display.update(dirty)
+        self.rect = rect
+
+    def hide(self, renderer):
+        """Remove the panel by having the renderer push a clean frame."""
+        self.rect = None
+        renderer.invalidate()
@@ -0,0 +1,213 @@
+"""
+Module: MinesweeperReplay
+Classes: Replay, ReplayArchive
+Functions: dumps, save, append, load
+Description: Compact, versioned binary save/replay format for Minesweeper boards.
+                A record is a fixed header, the mine layout packed one bit per
+                square, a delta-encoded move log, and a checkpoint index into
+                the log. Records can be concatenated into archives, which are
+                read through mmap without copying.
+Inputs: Minesweeper boards (either engine) with their move logs, or replay files.
+Outputs: Replay files/archives, and boards rebuilt by replaying moves through
+                apply_actions.
+External Sources: None
+Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
+Created: October 18, 2026
+Last Modified: October 18, 2026
+
+Record layout (little-endian, offsets relative to the start of the record):
+    header      HEADER struct below
+    mines       ceil(width * height / 8) bytes, row-major, least significant bit first
+                (empty if mines were never placed)
+    moves       per move: varint(time delta ms << 2 | action), varint(zigzag dx), varint(zigzag dy)
+                deltas are from the previous move, starting at time 0, square (0, 0)
+    index       one CHECKPOINT per checkpoint_interval moves: byte offset into the move
+                log plus the time and square of the move before it, so decoding can
+                start at any checkpoint
+"""
+
+import mmap
+import struct
+import time
+import weakref
+from itertools import islice
+
+from MinesweeperBoard import Minesweeper
+
+MAGIC = b"MSWR"
+VERSION = 1
+# magic, version, flags, width, height, num_mines, move_count, checkpoint_interval,
+# mines_offset, moves_offset, index_offset, record_size
+HEADER = struct.Struct("<4sHHIIIIIQQQQ")
+CHECKPOINT = struct.Struct("<QQII")  # log offset, previous time ms, previous x, previous y
+CHECKPOINT_INTERVAL = 256
+
+# Header flags
+FLAG_MINES_PLACED = 1
+FLAG_SAFE_OPENING = 2
+FLAG_NO_GUESS = 4
+
+def _write_varint(out, value):
+    """Append an unsigned LEB128 varint to a bytearray."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(buffer, pos):
+    """Read an unsigned LEB128 varint. Returns (value, next position)."""
+    value = shift = 0
+    while True:
+        byte = buffer[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+def _zigzag(value):
+    """Map signed to unsigned so small negative deltas stay small."""
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+def _unzigzag(value):
+    """Inverse of _zigzag."""
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+def dumps(board, checkpoint_interval=CHECKPOINT_INTERVAL):
+    """Serialize a board's mine layout and move log to bytes."""
+    flags = (FLAG_MINES_PLACED * bool(board.mines_placed)
+             | FLAG_SAFE_OPENING * bool(getattr(board, "safe_opening", False))
+             | FLAG_NO_GUESS * bool(getattr(board, "no_guess", False)))
+    mines = board.mine_bits() if board.mines_placed else b""
+
+    log = bytearray()
+    index = bytearray()
+    prev_t = prev_x = prev_y = 0
+    for number, (t, action, x, y) in enumerate(board.move_log):
+        if number % checkpoint_interval == 0:
+            index += CHECKPOINT.pack(len(log), prev_t, prev_x, prev_y)
+        if t < prev_t:
+            raise ValueError(f"move {number} is timed {t} ms, before the previous move at {prev_t} ms")
+        _write_varint(log, (t - prev_t) << 2 | action)
+        _write_varint(log, _zigzag(x - prev_x))
+        _write_varint(log, _zigzag(y - prev_y))
+        prev_t, prev_x, prev_y = t, x, y
+
+    mines_offset = HEADER.size
+    moves_offset = mines_offset + len(mines)
+    index_offset = moves_offset + len(log)
+    record_size = index_offset + len(index)
+    header = HEADER.pack(MAGIC, VERSION, flags, board.width, board.height, board.num_mines,
+                         len(board.move_log), checkpoint_interval,
+                         mines_offset, moves_offset, index_offset, record_size)
+    return header + mines + bytes(log) + bytes(index)
+
+def save(board, path):
+    """Write a board to a replay file, replacing it."""
+    with open(path, "wb") as f:
+        f.write(dumps(board))
+
+def append(board, path):
+    """Append a board as a new record at the end of a replay archive."""
+    with open(path, "ab") as f:
+        f.write(dumps(board))
+
+class Replay:
+    def __init__(self, buffer, offset=0):
+        """Read-only view of one replay record inside buffer (bytes, memoryview or mmap). Nothing is copied."""
+        self.buffer = memoryview(buffer)
+        self.offset = offset
+        (magic, version, self.flags, self.width, self.height, self.num_mines, self.move_count,
+         self.checkpoint_interval, self._mines_offset, self._moves_offset, self._index_offset,
+         self.size) = HEADER.unpack_from(self.buffer, offset)
+        if magic != MAGIC:
+            raise ValueError(f"Not a Minesweeper replay (bad magic {magic!r} at offset {offset})")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+
+    def mine_bits(self):
+        """Zero-copy view of the packed mine layout, or None if mines were never placed."""
+        if not self.flags & FLAG_MINES_PLACED:
+            return None
+        start = self.offset + self._mines_offset
+        return self.buffer[start:self.offset + self._moves_offset]
+
+    def moves(self, start=0):
+        """Yield (time ms, action, x, y) for moves start onwards, decoding from the nearest checkpoint."""
+        if start >= self.move_count:
+            return
+        checkpoint = start // self.checkpoint_interval
+        pos, t, x, y = CHECKPOINT.unpack_from(self.buffer, self.offset + self._index_offset + checkpoint * CHECKPOINT.size)
+        pos += self.offset + self._moves_offset
+        buffer = self.buffer
+        for number in range(checkpoint * self.checkpoint_interval, self.move_count):
+            packed, pos = _read_varint(buffer, pos)
+            dx, pos = _read_varint(buffer, pos)
+            dy, pos = _read_varint(buffer, pos)
+            t += packed >> 2
+            x += _unzigzag(dx)
+            y += _unzigzag(dy)
+            if number >= start:
+                yield t, packed & 3, x, y
+
+    def move(self, number):
+        """Return move number (time ms, action, x, y) without decoding the whole log."""
+        if not 0 <= number < self.move_count:
+            raise IndexError(f"move {number} out of range (0-{self.move_count - 1})")
+        return next(self.moves(number))
+
+    def board(self, board_class=Minesweeper, upto=None):
+        """Rebuild the board with the first upto moves (default all) replayed in one
+        apply_actions batch. The board's move log keeps the recorded timestamps, and later
+        moves are timed on from the last one, so the board can be saved again."""
+        board = board_class(self.width, self.height, self.num_mines,
+                            safe_opening=bool(self.flags & FLAG_SAFE_OPENING), no_guess=bool(self.flags & FLAG_NO_GUESS))
+        bits = self.mine_bits()
+        if bits is not None:
+            board.load_mine_bits(bits)
+            bits.release()
+        upto = self.move_count if upto is None else min(upto, self.move_count)
+        recorded = list(islice(self.moves(), upto))
+        board.apply_actions((action, x, y) for _, action, x, y in recorded)
+        board.move_log = recorded
+        if recorded:
+            board.move_start = time.perf_counter() - recorded[-1][0] / 1000
+        return board
+
+    def release(self):
+        """Drop the view of the underlying buffer so it can be closed."""
+        self.buffer.release()
+
+class ReplayArchive:
+    def __init__(self, path):
+        """Memory-map a replay file or archive of concatenated records for reading."""
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._replays = weakref.WeakSet()  # Live record views, released on close
+
+    def __iter__(self):
+        """Yield each Replay record in file order, jumping from header to header."""
+        offset = 0
+        while offset < len(self._map):
+            replay = Replay(self._map, offset)
+            self._replays.add(replay)
+            yield replay
+            offset += replay.size
+
+    def close(self):
+        """Release all record views and unmap the file."""
+        for replay in list(self._replays):
+            replay.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def load(path, board_class=Minesweeper, upto=None):
+    """Load the first record of a replay file and return the replayed board."""
+    with ReplayArchive(path) as archive:
+        return next(iter(archive)).board(board_class, upto)
@@ -0,0 +1,332 @@
+"""
+Module: MinesweeperServer
+Classes: Client, Room, MinesweeperServer
+Functions: encode_square, encode, main
+Description: Asyncio multiplayer/spectator server. Hosts any number of rooms, each
+                with its own board and lock. Players send reveal, flag and
+                chord commands; after each move the server broadcasts only the cells
+                that changed. Each client has a bounded outgoing queue, and a
+                client that falls behind has its backlog dropped and gets one
+                fresh snapshot instead, so slow spectators never hold up a room.
+Inputs: JSON-lines commands over TCP.
+Outputs: JSON-lines snapshots, deltas, acks and errors over TCP.
+External Sources: None
+Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
+Created: October 18, 2026
+Last Modified: October 18, 2026
+
+Usage:
+    python Minesweeper/MinesweeperServer.py --port 8765
+
+Protocol (one JSON object per line):
+    client -> server
+        {"op": "join", "room": "lobby", "role": "player"|"spectator", "width": 30, "height": 16, "mines": 99}
+            (size and mines only matter for the client that creates the room)
+        {"op": "reveal"|"flag"|"chord", "x": 3, "y": 4, "id": 17, "t": 1700000000.0}
+            (id and t are echoed back so clients can match replies and time the fan-out)
+        {"op": "new"}     start a new board once the current game has ended
+        {"op": "sync"}    ask for a fresh snapshot
+    server -> client
+        {"type": "snapshot", "room", "you", "version", "width", "height", "mines", "flags_remaining",
+         "game_over", "game_won", "rows": ["??1F*...", ...]}
+        {"type": "delta", "version", "cells": [[x, y, code], ...], "by", "id", "t",
+         "flags_remaining", "game_over", "game_won"}
+        {"type": "ack", "id"}        the move changed nothing
+        {"type": "error", "message"}
+    Cell codes: "0"-"8" revealed number, "*" mine, "F" flag, "?" hidden.
+    "you" is the client's id, matching "by" on the deltas of its own moves. Deltas carry a room
+    version; clients ignore deltas at or below their snapshot's version.
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+from itertools import count
+
+from MinesweeperBoard import SNAPSHOT_TEXT
+from MinesweeperSimulation import board_class_for
+
+DEFAULT_PORT = 8765
+QUEUE_SIZE = 256           # Outgoing messages held per client before it is resynced
+OFFLOAD_CELLS = 250_000    # Boards at least this big reveal in a worker thread so other rooms keep moving
+MAX_CELLS = 4_000_000
+STREAM_LIMIT = 1 << 24     # Line length limit for readers; snapshots of big boards are long lines
+# Bytes buffered per client, in asyncio and in the kernel, before writes wait for the reader. Left
+# at the defaults (64 KiB, and a send buffer the kernel grows to megabytes) a reader that has stopped
+# reading absorbs thousands of deltas before its queue fills and it is resynced.
+WRITE_BUFFER = 16 * 1024
+SEND_BUFFER = 64 * 1024
+
+# Outgoing queue markers
+RESYNC = object()
+CLOSE = object()
+
+def encode_square(value):
+    """One-character code for a get_display_square value."""
+    if value == "F" or value == "?":
+        return value
+    value = int(value)
+    return "*" if value == -1 else str(value)
+
+def encode(message):
+    """Serialize a message as one JSON line."""
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+class Client:
+    def __init__(self, client_id, writer, queue_size=QUEUE_SIZE):
+        """Connection state: outgoing queue of (room version or None, encoded line or marker)."""
+        self.id = client_id
+        self.writer = writer
+        self.queue = asyncio.Queue(queue_size)
+        self.room = None
+        self.role = None
+        self.synced_version = -1  # Version of the last snapshot or delta sent
+        self.resyncs = 0          # Times the queue overflowed
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER)
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER)
+
+    def send(self, data, version=None):
+        """Queue an encoded line without waiting. A full queue means the client can't keep
+        up: its backlog is dropped and replaced by a single resync."""
+        try:
+            self.queue.put_nowait((version, data))
+        except asyncio.QueueFull:
+            self.resyncs += 1
+            self.resync()
+
+    def resync(self):
+        """Drop anything queued and send a fresh snapshot next."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait((None, RESYNC))
+
+    def close(self):
+        """Stop the pump after whatever is queued."""
+        try:
+            self.queue.put_nowait((None, CLOSE))
+        except asyncio.QueueFull:
+            self.resync() # Frees the queue; the pump is cancelled on disconnect anyway
+
+    async def pump(self):
+        """Write queued messages to the socket, waiting for slow readers (drain)."""
+        while True:
+            version, data = await self.queue.get()
+            if data is CLOSE:
+                return
+            if data is RESYNC:
+                if self.room is None:
+                    continue
+                async with self.room.lock: # Never snapshot a board mid-move
+                    version, data = self.room.version, self.room.snapshot(self.id)
+            elif version is not None and version <= self.synced_version:
+                continue # Already covered by a newer snapshot
+            self.writer.write(data)
+            await self.writer.drain()
+            if version is not None:
+                self.synced_version = version
+
+class Room:
+    def __init__(self, name, board_factory):
+        """A board shared by the clients that joined it. board_factory() makes a new board."""
+        self.name = name
+        self.board_factory = board_factory
+        self.board = board_factory()
+        self.lock = asyncio.Lock()
+        self.clients = set()
+        self.version = 0
+        self._rows = (None, None)  # (version, encoded rows), shared by every snapshot of that version
+
+    def snapshot(self, client_id=None):
+        """Encoded snapshot of the whole board for client_id."""
+        board = self.board
+        if self._rows[0] != self.version:
+            self._rows = (self.version, [bytes(row).translate(SNAPSHOT_TEXT).decode() for row in board.snapshot()])
+        return encode({
+            "type": "snapshot",
+            "room": self.name,
+            "you": client_id,
+            "version": self.version,
+            "width": board.width,
+            "height": board.height,
+            "mines": board.num_mines,
+            "flags_remaining": board.flags_remaining,
+            "game_over": board.is_game_over(),
+            "game_won": board.is_game_won(),
+            "rows": self._rows[1],
+        })
+
+    def broadcast(self, data, version):
+        """Queue one encoded message for every client in the room."""
+        for client in self.clients:
+            client.send(data, version)
+
+    async def move(self, client, action, x, y, move_id=None, sent=None):
+        """Apply a reveal, flag or chord and broadcast the changed cells."""
+        async with self.lock:
+            board = self.board
+            if not (0 <= x < board.width and 0 <= y < board.height):
+                raise ValueError(f"square ({x}, {y}) is off the {board.width}x{board.height} board")
+            if action in ("reveal", "chord"):
+                opener = board.reveal_square if action == "reveal" else board.chord_square
+                if board.width * board.height >= OFFLOAD_CELLS:
+                    work = asyncio.ensure_future(asyncio.to_thread(opener, x, y))
+                    try:
+                        cells = await asyncio.shield(work)
+                    except asyncio.CancelledError:
+                        await work # The worker is still changing the board: keep the lock until it is done
+                        self.version += 1
+                        for other in self.clients:
+                            other.resync() # The move's delta is never sent
+                        raise
+                else:
+                    cells = opener(x, y)
+            else:
+                before = board.get_display_square(x, y)
+                board.toggle_flag(x, y)
+                cells = [(x, y)] if board.get_display_square(x, y) != before else []
+            if not len(cells):
+                client.send(encode({"type": "ack", "id": move_id}))
+                return
+            self.version += 1
+            self.broadcast(encode({
+                "type": "delta",
+                "version": self.version,
+                "cells": [[int(cx), int(cy), encode_square(board.get_display_square(cx, cy))] for cx, cy in cells],
+                "by": client.id,
+                "id": move_id,
+                "t": sent,
+                "flags_remaining": board.flags_remaining,
+                "game_over": board.is_game_over(),
+                "game_won": board.is_game_won(),
+            }), self.version)
+
+    async def reset(self):
+        """Start a new board if the current game has ended, and resync everyone."""
+        async with self.lock:
+            if not (self.board.is_game_over() or self.board.is_game_won()):
+                return
+            self.board = self.board_factory()
+            self.version += 1
+            for client in self.clients:
+                client.resync()
+
+class MinesweeperServer:
+    def __init__(self, board_class, queue_size=QUEUE_SIZE):
+        """Server state: rooms by name, created on first join and dropped when empty."""
+        self.board_class = board_class
+        self.queue_size = queue_size
+        self.rooms = {}
+        self.overflows = 0  # Resyncs of disconnected clients whose queues overflowed
+        self._ids = count(1)
+        self._connections = {}  # Handler task -> its Client
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT):
+        """Start listening. Returns the asyncio server (port 0 picks a free port)."""
+        return await asyncio.start_server(self.handle, host, port, limit=STREAM_LIMIT)
+
+    async def close(self):
+        """Close every connection and wait for its handler to finish (a move in progress completes
+        first). Call before the event loop exits, which would otherwise cancel the handlers."""
+        for client in self._connections.values():
+            client.writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def handle(self, reader, writer):
+        """Serve one connection until it closes."""
+        client = Client(next(self._ids), writer, self.queue_size)
+        pump = asyncio.create_task(client.pump())
+        handler = asyncio.current_task()
+        self._connections[handler] = client
+        try:
+            while line := await reader.readline():
+                try:
+                    await self.dispatch(client, json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    client.send(encode({"type": "error", "message": str(e)}))
+        except ConnectionError:
+            pass
+        finally:
+            self.leave(client)
+            self.overflows += client.resyncs
+            client.close()
+            pump.cancel()
+            writer.close()
+            del self._connections[handler]
+            await asyncio.wait([pump])
+
+    async def dispatch(self, client, request):
+        """Handle one command."""
+        op = request["op"]
+        if op == "join":
+            self.join(client, request)
+        elif op in ("reveal", "flag", "chord"):
+            if client.room is None or client.role != "player":
+                raise ValueError("join a room as a player to make moves")
+            await client.room.move(client, op, int(request["x"]), int(request["y"]), request.get("id"), request.get("t"))
+        elif op == "new":
+            if client.room is None:
+                raise ValueError("not in a room")
+            await client.room.reset()
+        elif op == "sync":
+            client.resync()
+        else:
+            raise ValueError(f"unknown op {op!r}")
+
+    def join(self, client, request):
+        """Move a client into a room, creating the room if needed, and queue its snapshot."""
+        role = request.get("role", "player")
+        if role not in ("player", "spectator"):
+            raise ValueError(f"unknown role {role!r}")
+        name = str(request["room"])
+        room = self.rooms.get(name)
+        if room is None:
+            width, height = int(request.get("width", 30)), int(request.get("height", 16))
+            mines = int(request.get("mines", 99))
+            if not (0 < width * height <= MAX_CELLS and 0 < mines < width * height):
+                raise ValueError(f"bad board {width}x{height} with {mines} mines")
+            room = self.rooms[name] = Room(name, lambda: self.board_class(width, height, mines))
+        self.leave(client)
+        client.room, client.role = room, role
+        client.synced_version = -1
+        room.clients.add(client)
+        client.resync()
+
+    def leave(self, client):
+        """Remove a client from its room, dropping the room once it is empty."""
+        room = client.room
+        if room is None:
+            return
+        room.clients.discard(client)
+        if not room.clients:
+            self.rooms.pop(room.name, None)
+        client.room = None
+
+async def serve(host, port, board_class, queue_size=QUEUE_SIZE):
+    """Run the server until cancelled."""
+    game_server = MinesweeperServer(board_class, queue_size)
+    server = await game_server.start(host, port)
+    print(f"Minesweeper server listening on {', '.join(str(s.getsockname()) for s in server.sockets)}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await game_server.close()
+
+def main(argv=None):
+    """Parse command line arguments and run the server."""
+    parser = argparse.ArgumentParser(description="Minesweeper multiplayer/spectator server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--engine", choices=("list", "numpy"), default="list")
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE, help="messages queued per client before it is resynced")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, board_class_for(args.engine), args.queue_size))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Module: MinesweeperSharedSnapshot
+Classes: SnapshotPublisher, SnapshotReader
+Functions: main
+Description: Publishes a board's int8 display snapshot through
+                multiprocessing.shared_memory so other processes (analysers,
+                solvers, recorders) can read the live board without copying or
+                pickling. The board writes its snapshot straight into the shared
+                block; a small header carries the board size, game status and a
+                sequence number that is odd while a move is being applied.
+Inputs: A board (either engine) to publish, or the name of a published block to read.
+Outputs: A shared memory block, and read-only views of it in reader processes.
+External Sources: None (NumPy optional, for SnapshotReader.array)
+Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
+Created: October 18, 2026
+Last Modified: October 18, 2026
+
+Usage:
+    publisher = SnapshotPublisher(board, "minesweeper")   # in the game process
+    board.reveal_square(3, 4)                             # readers see it immediately
+    publisher.close()
+
+    python Minesweeper/MinesweeperSharedSnapshot.py minesweeper --watch   # in another process
+
+Block layout (little-endian):
+    header      HEADER struct below, padded to CELLS_OFFSET bytes
+    cells       width * height int8 snapshot codes, row-major (see MinesweeperBoard.snapshot)
+"""
+
+import argparse
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+from MinesweeperBoard import SNAPSHOT_TEXT
+
+# magic, format version, status bits, width, height, mines, flags remaining, moves, sequence
+HEADER = struct.Struct("<4sBBxxIIIiIQ")
+MAGIC = b"MSNP"
+FORMAT_VERSION = 1
+CELLS_OFFSET = 64
+
+# Status bits
+STATUS_GAME_OVER = 1
+STATUS_GAME_WON = 2
+
+# Board methods that change the snapshot; the publisher wraps them to keep the header current
+MOVE_METHODS = ("reveal_square", "toggle_flag", "chord_square", "apply_actions")
+
+SEQUENCE_OFFSET = HEADER.size - 8
+
+_MISSING = object()
+
+class SnapshotPublisher:
+    def __init__(self, board, name=None):
+        """Create a shared memory block for board (name=None picks a free name) and move the
+        board's snapshot into it. The board's move methods are wrapped on the instance until close()."""
+        self.board = board
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=CELLS_OFFSET + board.width * board.height)
+        self.sequence = 0
+        self._depth = 0     # Nested move calls (apply_actions calls toggle_flag/chord_square)
+        self._wrapped = []  # (method name, wrapper, original own attribute or _MISSING)
+        self.write_header()
+        board.share_snapshot(self.shm.buf[CELLS_OFFSET:CELLS_OFFSET + board.width * board.height])
+        for name in MOVE_METHODS:
+            method = getattr(board, name, None)
+            if method is None:
+                continue
+
+            def published(*args, _method=method, **kwargs):
+                self.begin()
+                try:
+                    return _method(*args, **kwargs)
+                finally:
+                    self.end()
+
+            self._wrapped.append((name, published, vars(board).get(name, _MISSING)))
+            setattr(board, name, published)
+
+    @property
+    def name(self):
+        """Name readers pass to SnapshotReader."""
+        return self.shm.name
+
+    def write_header(self):
+        """Write the header with the board's current status."""
+        board = self.board
+        status = (STATUS_GAME_OVER if board.is_game_over() else 0) | (STATUS_GAME_WON if board.is_game_won() else 0)
+        HEADER.pack_into(self.shm.buf, 0, MAGIC, FORMAT_VERSION, status, board.width, board.height, board.num_mines,
+                         board.flags_remaining, len(board.move_log), self.sequence)
+
+    def begin(self):
+        """Mark the snapshot as changing (odd sequence) before a move."""
+        self._depth += 1
+        if self._depth == 1:
+            self.sequence += 1
+            struct.pack_into("<Q", self.shm.buf, SEQUENCE_OFFSET, self.sequence)
+
+    def end(self):
+        """Publish the new status and an even sequence once the outermost move is done."""
+        self._depth -= 1
+        if self._depth == 0:
+            self.sequence += 1
+            self.write_header()
+
+    def close(self, unlink=True):
+        """Unwrap the board, give it back a private copy of its snapshot, and release the block
+        (unlinking it unless unlink=False). Drop any snapshot() views of the board first."""
+        board = self.board
+        for name, wrapper, original in reversed(self._wrapped):
+            if vars(board).get(name) is not wrapper: # Already replaced by someone else's hook
+                continue
+            if original is _MISSING:
+                delattr(board, name) # Falls back to the class method
+            else:
+                setattr(board, name, original)
+        self._wrapped = []
+        board.share_snapshot(bytearray(board.width * board.height))
+        self.shm.close()
+        if unlink:
+            # A reader in this process may have unregistered the shared name from the resource tracker
+            resource_tracker.register(self.shm._name, "shared_memory")
+            self.shm.unlink()
+
+class SnapshotReader:
+    def __init__(self, name):
+        """Attach to a block published under name. Reading never copies unless asked to."""
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError: # Python < 3.13 always tracks, and would unlink the publisher's block on exit
+            self.shm = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(self.shm._name, "shared_memory")
+        magic, version, _, self.width, self.height, self.num_mines, _, _, _ = HEADER.unpack_from(self.shm.buf, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.shm.close()
+            raise ValueError(f"{name!r} is not a version {FORMAT_VERSION} Minesweeper snapshot")
+        self.cells = self.shm.buf[CELLS_OFFSET:CELLS_OFFSET + self.width * self.height].toreadonly().cast("b")
+        self.rows = [self.cells[y * self.width:(y + 1) * self.width] for y in range(self.height)]
+
+    def status(self):
+        """Returns the header as a dict; sequence is odd while a move is being applied."""
+        _, _, status, _, _, _, flags_remaining, moves, sequence = HEADER.unpack_from(self.shm.buf, 0)
+        return {
+            "sequence": sequence,
+            "flags_remaining": flags_remaining,
+            "moves": moves,
+            "game_over": bool(status & STATUS_GAME_OVER),
+            "game_won": bool(status & STATUS_GAME_WON),
+        }
+
+    def read(self, into=None):
+        """Copy a consistent snapshot (taken between moves) into into (a bytearray, reused if
+        given). Returns (status, cells). Use rows or cells directly to read live without copying."""
+        if into is None:
+            into = bytearray(self.width * self.height)
+        while True:
+            status = self.status()
+            if status["sequence"] & 1: # Move in progress
+                time.sleep(0)
+                continue
+            into[:] = self.cells.cast("B")
+            if self.status() == status:
+                return status, into
+
+    def array(self):
+        """Live read-only (height, width) NumPy view of the cells."""
+        import numpy as np # Optional dependency
+        return np.frombuffer(self.cells, dtype=np.int8).reshape(self.height, self.width)
+
+    def text(self, cells=None):
+        """Board rows as text ("0"-"8", "*" mine, "?" hidden, "F" flag), from cells or the live block."""
+        data = bytes(self.cells if cells is None else cells).translate(SNAPSHOT_TEXT).decode()
+        return [data[y * self.width:(y + 1) * self.width] for y in range(self.height)]
+
+    def close(self):
+        """Detach from the block. Drop any views taken from rows, cells or array() first."""
+        self.rows = []
+        self.cells.release()
+        self.shm.close()
+
+def main(argv=None):
+    """Print a published board, or keep printing it as it changes with --watch."""
+    parser = argparse.ArgumentParser(description="Read a shared Minesweeper snapshot")
+    parser.add_argument("name", help="shared memory name given to SnapshotPublisher")
+    parser.add_argument("--watch", action="store_true", help="print the board again after every move")
+    parser.add_argument("--interval", type=float, default=0.05, help="seconds between checks with --watch")
+    args = parser.parse_args(argv)
+    reader = SnapshotReader(args.name)
+    buffer = bytearray(reader.width * reader.height)
+    sequence = None
+    try:
+        while True:
+            status, cells = reader.read(buffer)
+            if status["sequence"] != sequence:
+                sequence = status["sequence"]
+                print(f"moves {status['moves']}, flags remaining {status['flags_remaining']}"
+                      + (", game over" if status["game_over"] else ", won" if status["game_won"] else ""))
+                print("\n".join(reader.text(cells)), flush=True)
+            if not args.watch:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+
+if __name__ == "__main__":
+    main()
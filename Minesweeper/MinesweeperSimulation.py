@@ -0,0 +1,143 @@
+"""
+Module: MinesweeperSimulation
+Functions: random_policy, play_game, run_games, main
+Description: Headless Minesweeper. Plays seeded games with a pluggable move policy
+                against the board engines, with no Pygame import, and fans
+                batches out over a process pool. Results stream as JSON lines.
+Inputs: Command line arguments (board size, mine counts, number of games, policy).
+Outputs: One JSON object per game (win/loss, moves, time) on stdout or a file.
+External Sources: None
+Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
+Created: October 18, 2026
+Last Modified: October 18, 2026
+
+Usage:
+    python Minesweeper/MinesweeperSimulation.py --games 10000 --width 30 --height 16 --mines 99 --workers 8
+
+A policy is any importable callable policy(board, rng) -> (action, x, y), where
+action is "reveal", "flag" or "chord". Policies should only look at what a player can
+see (get_display_square / get_display_board). Pass built-in names or "module:function".
+"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+import sys
+import time
+from itertools import product
+
+from MinesweeperBoard import Minesweeper
+from MinesweeperSolver import solver_policy
+
+def random_policy(board, rng):
+    """Reveal a uniformly random hidden, unflagged square."""
+    hidden = [(x, y) for y in range(board.height) for x in range(board.width)
+              if board.get_display_square(x, y) == "?"]
+    x, y = rng.choice(hidden)
+    return "reveal", x, y
+
+# Built-in policies by name
+POLICIES = {
+    "random": random_policy,
+    "solver": solver_policy,
+}
+
+def load_policy(name):
+    """Resolve a policy name or "module:function" import path to a callable."""
+    if name in POLICIES:
+        return POLICIES[name]
+    module_name, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown policy {name!r}; use one of {sorted(POLICIES)} or module:function")
+    return getattr(importlib.import_module(module_name), attr)
+
+def board_class_for(engine):
+    """Return the board class for an engine name ("list" or "numpy")."""
+    if engine == "numpy":
+        from MinesweeperBoardNumpy import NumpyMinesweeper # Optional dependency
+        return NumpyMinesweeper
+    return Minesweeper
+
+def play_game(seed, width, height, num_mines, policy="random", engine="list", opening="single"):
+    """Play one game to completion and return its result as a dict. opening is "single"
+    (only the first click is safe), "safe" (3x3 safe opening) or "no-guess"."""
+    rng = random.Random(seed)
+    board = board_class_for(engine)(width, height, num_mines, seed=seed,
+                                    safe_opening=opening == "safe", no_guess=opening == "no-guess")
+    choose = load_policy(policy)
+    moves = 0
+    max_moves = 2 * width * height # Guard against policies that never finish
+    start = time.perf_counter()
+    while not board.is_game_over() and not board.is_game_won() and moves < max_moves:
+        board.apply_actions([choose(board, rng)])
+        moves += 1
+    return {
+        "seed": seed,
+        "width": width,
+        "height": height,
+        "mines": num_mines,
+        "policy": policy,
+        "opening": opening,
+        "won": board.is_game_won(),
+        "moves": moves,
+        "safe_revealed": board.safe_revealed,
+        "seconds": round(time.perf_counter() - start, 6),
+    }
+
+def _play_config(config):
+    """Process pool entry point: unpack one (seed, width, height, mines, policy, engine, opening) tuple."""
+    return play_game(*config)
+
+def run_games(num_games, width, height, mine_counts, policy="random", engine="list", seed=0, workers=None,
+              chunksize=None, opening="single"):
+    """Yield results for num_games seeded games per mine count, in order, as they finish.
+    workers=1 plays in this process; otherwise games are spread over a process pool."""
+    configs = [(seed + index, width, height, mines, policy, engine, opening)
+               for mines, index in product(mine_counts, range(num_games))]
+    if workers == 1:
+        yield from map(_play_config, configs)
+        return
+    from concurrent.futures import ProcessPoolExecutor # Costs ~30 ms to import, only needed for pools
+    workers = workers or os.cpu_count() or 1
+    # Chunks amortize pickling overhead across many small games
+    chunksize = chunksize or max(1, len(configs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_play_config, configs, chunksize=chunksize)
+
+def main(argv=None):
+    """Parse command line arguments and stream game results as JSON lines."""
+    parser = argparse.ArgumentParser(description="Headless Minesweeper batch runner")
+    parser.add_argument("--games", type=int, default=100, help="games per mine count")
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--height", type=int, default=10)
+    parser.add_argument("--mines", type=int, nargs="+", default=[15], help="one or more mine counts to sweep")
+    parser.add_argument("--policy", default="random", help=f"one of {sorted(POLICIES)} or module:function")
+    parser.add_argument("--engine", choices=("list", "numpy"), default="list")
+    parser.add_argument("--opening", choices=("single", "safe", "no-guess"), default="single",
+                        help="first click safe, 3x3 safe opening, or no-guess boards")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game; game i uses seed + i")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count, 1 = no pool)")
+    parser.add_argument("--output", default="-", help="JSON lines file, - for stdout")
+    args = parser.parse_args(argv)
+    load_policy(args.policy) # Fail fast on a bad policy name
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    wins = games = 0
+    start = time.perf_counter()
+    try:
+        for result in run_games(args.games, args.width, args.height, args.mines, args.policy,
+                                args.engine, args.seed, args.workers, opening=args.opening):
+            out.write(json.dumps(result) + "\n")
+            games += 1
+            wins += result["won"]
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    print(f"{games} games, {wins} wins ({wins / max(games, 1):.2%}), {elapsed:.2f}s, "
+          f"{games / max(elapsed, 1e-9):.0f} games/s", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+"""
+Module: MinesweeperSolver
+Classes: Solver
+Functions: solver_policy, solvable_without_guessing
+Description: Constraint-propagation Minesweeper solver working from get_display_board()
+                output or a board's int8 snapshot(). Single-cell and subset rules
+                run first; what is left of the frontier is split into
+                independent components that are each enumerated (memoized
+                across moves) to give exact mine probabilities for every hidden
+                square. State is kept between moves, so each update only
+                re-examines the squares that changed.
+Inputs: Board size, mine count, and display boards as the game progresses.
+Outputs: Safe squares, known mines, mine probabilities, and the next move.
+External Sources: None
+Authors: Kiara [Sam] Grimsley, Reeny Huang, Lauren D'Souza, Audrey Pan, Ella Nguyen, Hart Nurnberg
+Created: October 18, 2026
+Last Modified: October 18, 2026
+"""
+
+import weakref
+from collections import deque
+from math import exp, lgamma
+
+from MinesweeperBoard import SNAPSHOT_HIDDEN, SNAPSHOT_FLAG
+
+# Backtracking nodes allowed per move, shared by every component enumerated for it (each node
+# costs a few microseconds, so this keeps a move within a few milliseconds); components that
+# don't fit fall back to local estimates
+MAX_ENUMERATION_NODES = 5_000
+# Display values that say nothing about a square: hidden or flagged, as text or snapshot codes
+UNKNOWN = ("?", "F", SNAPSHOT_HIDDEN, SNAPSHOT_FLAG)
+# Cached component solutions kept across moves
+MAX_CACHED_COMPONENTS = 4096
+
+class ComponentTooLarge(Exception):
+    """Raised when a frontier component exceeds the enumeration budget."""
+
+class Solver:
+    def __init__(self, width, height, num_mines):
+        """Create a solver for a width x height board with num_mines mines."""
+        self.width = width
+        self.height = height
+        self.num_mines = num_mines
+        self.view = [["?"] * width for _ in range(height)]  # Last display board seen
+        self.hidden = {(x, y) for y in range(height) for x in range(width)}
+        self.known_mines = set()
+        self.known_safe = set()   # Hidden squares proven safe
+        self.constraints = {}     # Revealed number square -> (unknown neighbours, mines among them)
+        self.open_constraints = set()  # Number squares that still have unknown neighbours
+        self._components = {}     # Component signature -> enumeration result, reused across moves
+        self._probabilities = None
+        self._moves_seen = 0      # Entries of the board's move_log already applied by update_from_board
+
+    def neighbours(self, x, y):
+        """Yield the in-bounds neighbours of (x, y)."""
+        for ny in range(max(y - 1, 0), min(y + 2, self.height)):
+            for nx in range(max(x - 1, 0), min(x + 2, self.width)):
+                if nx != x or ny != y:
+                    yield nx, ny
+
+    def update(self, display_board, changed=None):
+        """Bring the solver up to date with a display board (get_display_board() or snapshot()).
+        changed optionally lists the (x, y) squares that changed since the last update, skipping the diff."""
+        if changed is None:
+            changed = ((x, y) for y in range(self.height) for x in range(self.width))
+        dirty = set()
+        for x, y in changed:
+            value = display_board[y][x]
+            if type(value) not in (int, str): # NumPy snapshots hold int8 scalars
+                value = int(value)
+            if value == self.view[y][x]:
+                continue
+            self.view[y][x] = value
+            if value in UNKNOWN: # Player flags are only a visual aid, not facts
+                continue
+            self.hidden.discard((x, y))
+            self.known_safe.discard((x, y))
+            if value >= 0:
+                self.constraints[(x, y)] = None
+                dirty.add((x, y))
+            # Neighbouring numbers just lost an unknown square
+            dirty.update(cell for cell in self.neighbours(x, y) if cell in self.constraints)
+        if dirty:
+            self._probabilities = None
+            self._propagate(dirty)
+
+    def update_from_board(self, board):
+        """Catch up with the moves logged on board since the last call. Only the squares they
+        opened are examined, found by searching outwards from each move through newly revealed
+        squares, so a move costs what it opened rather than the size of the board."""
+        display_board = board.snapshot()
+        log = board.move_log
+        stack = []
+        for _, _, x, y in log[self._moves_seen:]:
+            stack.append((x, y))
+            stack.extend(self.neighbours(x, y)) # A chord opens around an already revealed square
+        self._moves_seen = len(log)
+        changed, visited = [], set()
+        while stack:
+            cell = stack.pop()
+            if cell in visited:
+                continue
+            visited.add(cell)
+            x, y = cell
+            if self.view[y][x] not in UNKNOWN or int(display_board[y][x]) in UNKNOWN:
+                continue # Known before, or still hidden
+            changed.append(cell)
+            stack.extend(self.neighbours(x, y))
+        self.update(display_board, changed)
+
+    def _build_constraint(self, cell):
+        """Recompute the unknown neighbours and outstanding mine count of a number square."""
+        x, y = cell
+        unknown = set()
+        mines = self.view[y][x]
+        for neighbour in self.neighbours(x, y):
+            if neighbour in self.known_mines:
+                mines -= 1
+            elif neighbour in self.hidden and neighbour not in self.known_safe:
+                unknown.add(neighbour)
+        return frozenset(unknown), mines
+
+    def _nearby_constraints(self, cell):
+        """Yield number squares close enough to share an unknown neighbour with cell."""
+        x, y = cell
+        for ny in range(max(y - 2, 0), min(y + 3, self.height)):
+            for nx in range(max(x - 2, 0), min(x + 3, self.width)):
+                if (nx, ny) != cell and (nx, ny) in self.constraints:
+                    yield nx, ny
+
+    def _propagate(self, dirty):
+        """Apply the single-square and subset rules until nothing new is learned."""
+        queue = deque(dirty)
+        queued = set(dirty)
+        while queue:
+            cell = queue.popleft()
+            queued.discard(cell)
+            unknown, mines = self.constraints[cell] = self._build_constraint(cell)
+            if not unknown:
+                self.open_constraints.discard(cell)
+                continue
+            self.open_constraints.add(cell)
+            safe, found = set(), set()
+            if mines == 0:
+                safe = unknown
+            elif mines == len(unknown):
+                found = unknown
+            else:
+                # Subset rule: if another number's unknowns sit inside ours, the rest holds the difference
+                for other in self._nearby_constraints(cell):
+                    other_unknown, other_mines = self._build_constraint(other) # Stored one may be stale
+                    if not other_unknown or other_unknown == unknown:
+                        continue
+                    for small, small_mines, big, big_mines in ((other_unknown, other_mines, unknown, mines),
+                                                               (unknown, mines, other_unknown, other_mines)):
+                        if small < big:
+                            rest = big - small
+                            if big_mines - small_mines == 0:
+                                safe |= rest
+                            elif big_mines - small_mines == len(rest):
+                                found |= rest
+            if not safe and not found:
+                continue
+            self.known_safe |= safe
+            self.known_mines |= found
+            # Every number next to a newly known square needs another look
+            for known in safe | found:
+                for neighbour in self.neighbours(*known):
+                    if neighbour in self.constraints and neighbour not in queued:
+                        queue.append(neighbour)
+                        queued.add(neighbour)
+
+    def _frontier_components(self):
+        """Split the open constraints into independent groups that share no unknown squares.
+        Returns a list of (sorted cells, constraints) pairs."""
+        active = [self.constraints[cell] for cell in self.open_constraints]
+        parent = {}
+        def find(cell):
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            return cell
+        for unknown, _ in active:
+            cells = iter(unknown)
+            first = next(cells)
+            parent.setdefault(first, first)
+            for cell in cells:
+                parent.setdefault(cell, cell)
+                parent[find(cell)] = find(first)
+        groups = {}
+        for constraint in active:
+            groups.setdefault(find(next(iter(constraint[0]))), set()).add(constraint)
+        components = []
+        for constraints in groups.values():
+            cells = sorted({cell for unknown, _ in constraints for cell in unknown}, key=lambda c: (c[1], c[0]))
+            components.append((cells, constraints))
+        return components
+
+    def _enumerate(self, cells, constraints, budget):
+        """Count the mine layouts of one component. Returns (counts, cell_counts) where
+        counts[k] is the number of layouts with k mines and cell_counts[k][i] how many
+        of those put a mine on cells[i]. budget is a one-item list of nodes left for this
+        move, decremented as the search runs; raises ComponentTooLarge when it runs out."""
+        index = {cell: i for i, cell in enumerate(cells)}
+        constraint_list = [([index[cell] for cell in unknown], mines) for unknown, mines in constraints]
+        cell_constraints = [[] for _ in cells]
+        for j, (members, _) in enumerate(constraint_list):
+            for i in members:
+                cell_constraints[i].append(j)
+        placed = [0] * len(constraint_list)
+        left = [len(members) for members, _ in constraint_list]
+        need = [mines for _, mines in constraint_list]
+        counts = {}
+        cell_counts = {}
+        n = len(cells)
+        if n >= budget[0]: # Can't reach a single full layout
+            raise ComponentTooLarge
+        # Depth-first search over the cells in order. Iterative, since a frontier can be longer than
+        # Python's recursion limit: tried[i] is the value on cells[i] (-1: none yet) and i the depth
+        tried = [-1] * n
+        i = k = 0
+        budget[0] -= 1
+        while i >= 0:
+            if i == n:
+                counts[k] = counts.get(k, 0) + 1
+                row = cell_counts.setdefault(k, [0] * n)
+                for position, mine in enumerate(tried):
+                    row[position] += mine
+                i -= 1
+                continue
+            mine = tried[i]
+            if mine >= 0: # Undo the last value tried here
+                for j in cell_constraints[i]:
+                    placed[j] -= mine
+                    left[j] += 1
+                k -= mine
+            if mine == 1: # Both values tried: backtrack
+                tried[i] = -1
+                i -= 1
+                continue
+            mine += 1
+            tried[i] = mine
+            k += mine
+            ok = True
+            for j in cell_constraints[i]:
+                placed[j] += mine
+                left[j] -= 1
+                if placed[j] > need[j] or placed[j] + left[j] < need[j]:
+                    ok = False
+            if ok:
+                i += 1
+                budget[0] -= 1
+                if budget[0] < 0:
+                    raise ComponentTooLarge
+        return counts, cell_counts
+
+    def probabilities(self):
+        """Return {(x, y): probability of a mine} for every hidden square."""
+        if self._probabilities is not None:
+            return self._probabilities
+        probabilities = {cell: 1.0 for cell in self.known_mines}
+        probabilities.update((cell, 0.0) for cell in self.known_safe)
+        mines_left = self.num_mines - len(self.known_mines)
+
+        # Solve each frontier component exactly, reusing results from earlier moves
+        exact = []
+        frontier = set()
+        budget = [MAX_ENUMERATION_NODES]
+        # Smallest first, so one huge component can't starve the rest of the budget
+        for cells, constraints in sorted(self._frontier_components(), key=lambda component: len(component[0])):
+            frontier.update(cells)
+            key = frozenset(constraints)
+            result = self._components.get(key)
+            if result is None:
+                full_budget = budget[0] == MAX_ENUMERATION_NODES
+                try:
+                    result = self._enumerate(cells, constraints, budget)
+                except ComponentTooLarge:
+                    result = False
+                    budget[0] = 0
+                if result is not False or full_budget: # Retry starved components next move
+                    if len(self._components) >= MAX_CACHED_COMPONENTS:
+                        self._components.clear()
+                    self._components[key] = result
+            if result is False:
+                # Too many layouts to count: use the densest constraint on each square
+                for cell in cells:
+                    probabilities[cell] = max(mines / len(unknown) for unknown, mines in constraints if cell in unknown)
+                mines_left -= round(sum(probabilities[cell] for cell in cells))
+            else:
+                exact.append((cells, result))
+
+        others = [cell for cell in self.hidden
+                  if cell not in frontier and cell not in self.known_mines and cell not in self.known_safe]
+        rest = len(others)
+
+        def log_ways(total):
+            """Log of the ways to place the remaining mines outside the frontier (None if none)."""
+            outside = mines_left - total
+            if not 0 <= outside <= rest:
+                return None
+            return lgamma(rest + 1) - lgamma(outside + 1) - lgamma(rest - outside + 1)
+
+        # Mine-count distributions, convolved with and without each component
+        def convolve(a, b):
+            out = {}
+            for i, ca in a.items():
+                for j, cb in b.items():
+                    out[i + j] = out.get(i + j, 0) + ca * cb
+            return out
+        prefix = [{0: 1}]
+        for _, (counts, _) in exact:
+            prefix.append(convolve(prefix[-1], counts))
+        suffix = [{0: 1}]
+        for _, (counts, _) in reversed(exact):
+            suffix.append(convolve(suffix[-1], counts))
+        suffix.reverse()
+
+        combined = prefix[-1]
+        # Only ratios matter, so weigh each mine count against the likeliest one: exact counts of a
+        # big board are integers thousands of digits long that take milliseconds each to compute
+        scale = max((ways for ways in map(log_ways, combined) if ways is not None), default=0.0)
+        def weight(total):
+            """Ways to place the remaining mines outside the frontier, relative to the likeliest count."""
+            ways = log_ways(total)
+            return 0.0 if ways is None else exp(ways - scale)
+        total = sum(count * weight(t) for t, count in combined.items())
+        if total == 0: # Inconsistent view (shouldn't happen), fall back to uniform
+            uniform = max(mines_left, 0) / max(rest + len(frontier), 1)
+            for cell in list(frontier) + others:
+                probabilities.setdefault(cell, uniform)
+            self._probabilities = probabilities
+            return probabilities
+
+        for position, (cells, (counts, cell_counts)) in enumerate(exact):
+            excluded = convolve(prefix[position], suffix[position + 1])
+            weights = {k: sum(count * weight(k + t) for t, count in excluded.items()) for k in counts}
+            for i, cell in enumerate(cells):
+                probabilities[cell] = sum(row[i] * weights[k] for k, row in cell_counts.items()) / total
+        if rest:
+            expected = sum(count * weight(t) * (mines_left - t) for t, count in combined.items())
+            outside = expected / (total * rest)
+            for cell in others:
+                probabilities[cell] = outside
+        self._probabilities = probabilities
+        return probabilities
+
+    def safe_moves(self):
+        """Hidden squares proven safe, in row-major order."""
+        return sorted(self.known_safe, key=lambda c: (c[1], c[0]))
+
+    def hint(self, rng=None):
+        """Return (x, y, probability) of the safest square to reveal next."""
+        if len(self.hidden) == self.width * self.height: # Opening move is always safe
+            return self.width // 2, self.height // 2, 0.0
+        if self.known_safe: # Decided without probabilities
+            return min(self.known_safe, key=lambda c: (c[1], c[0])) + (0.0,)
+        probabilities = self.probabilities()
+        best = min(probabilities[cell] for cell in self.hidden if cell not in self.known_mines)
+        choices = sorted((cell for cell in self.hidden if cell not in self.known_mines and probabilities[cell] <= best + 1e-12),
+                         key=lambda c: (c[1], c[0]))
+        cell = rng.choice(choices) if rng is not None else choices[0]
+        return cell + (best,)
+
+    def next_move(self, rng=None):
+        """Return the next ("reveal", x, y) move."""
+        x, y, _ = self.hint(rng)
+        return "reveal", x, y
+
+# One solver per board, so headless games keep their state between moves
+_solvers = weakref.WeakKeyDictionary()
+
+def solver_policy(board, rng):
+    """Move policy for MinesweeperSimulation: reveal proven-safe squares, otherwise the
+    square with the lowest mine probability."""
+    solver = _solvers.get(board)
+    if solver is None:
+        solver = _solvers[board] = Solver(board.width, board.height, board.num_mines)
+    solver.update_from_board(board)
+    return solver.next_move(rng)
+
+def solvable_without_guessing(board, x, y):
+    """Play a board with mines already placed from a first reveal at (x, y), using only
+    proven-safe moves. True if that clears the board. Mutates board, so pass a scratch copy."""
+    solver = Solver(board.width, board.height, board.num_mines)
+    opened = list(board.reveal_square(x, y))
+    while len(opened) and not board.is_game_won():
+        solver.update(board.snapshot(), changed=[(int(cx), int(cy)) for cx, cy in opened])
+        # Open every proven-safe square in one batch per round
+        opened = board.apply_actions([("reveal", sx, sy) for sx, sy in solver.safe_moves()])["revealed"]
+    return board.is_game_won()
@@ -2,13 +2,42 @@
 Module: PlayMinesweeper
 Function: play_minesweeper
 Description: Run minesweeper game.
-Inputs: None
+Inputs: Optional board size, board engine, profiler output path and shared snapshot name on the command line.
 Outputs: Starts the Minesweeper game window.
 External Sources: None
 Author: Kiara [Sam] Grimsley
 Created: September 19, 2025
-Last Modified: September 19, 2025
+Last Modified: October 18, 2026
+
+Usage:
+    python Minesweeper/PlayMinesweeper.py [--width 10] [--height 10] [--engine list|numpy] [--profile metrics.csv] [--share NAME]
 """
 
-from MinesweeperGame import Game
-Game.play_minesweeper()
\ No newline at end of file
+import argparse
+
+from MinesweeperBoard import Minesweeper, BOARD_WIDTH, BOARD_HEIGHT
+
+def positive_int(text):
+    """argparse type for board sizes: an integer of at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return value
+
+parser = argparse.ArgumentParser(description="Play Minesweeper")
+parser.add_argument("--width", type=positive_int, default=BOARD_WIDTH, help="board width in cells")
+parser.add_argument("--height", type=positive_int, default=BOARD_HEIGHT, help="board height in cells")
+parser.add_argument("--engine", choices=("list", "numpy"), default="list", help="board engine, numpy for very large boards")
+parser.add_argument("--profile", metavar="PATH", help="start with the F3 profiler on and write its metrics (CSV, or JSON for .json) on exit")
+parser.add_argument("--share", metavar="NAME", help="publish the live board in shared memory under NAME (see MinesweeperSharedSnapshot)")
+parser.add_argument("--exit-after-first-frame", action="store_true", help="quit once the first frame is shown (startup benchmark)")
+args = parser.parse_args()
+if args.width * args.height < 2:
+    parser.error("the board needs at least 2 cells (the first click is always safe)")
+
+board_class = Minesweeper
+if args.engine == "numpy":
+    from MinesweeperBoardNumpy import NumpyMinesweeper # Optional dependency
+    board_class = NumpyMinesweeper
+from MinesweeperGame import Game # Imports Pygame, so only once the arguments are valid
+Game.play_minesweeper(board_class, args.width, args.height, args.profile, args.exit_after_first_frame, args.share)